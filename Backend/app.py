@@ -1,16 +1,26 @@
 from flask import Flask, jsonify, request, send_from_directory, Response, make_response
 from flask_cors import CORS
 from flask_compress import Compress
-import json
+import hashlib
 import os
 import threading
 import logging
 from functools import wraps
-from datetime import datetime, date
+from datetime import datetime
 import html
 from urllib.parse import urljoin, quote
-import re
-import unidecode
+import codec
+from slugs import make_slug
+from blog_render import render_post
+from rate_limit import RateLimiter, backend_from_env
+from search_index import build_suggest_index, normalize_search_text, TrigramIndex
+from result_cache import ResultCache
+from data_cache import DataCache
+from change_feed import ChangeFeed
+import bundles
+import stats
+import jsonl_store
+import compile_data
 
 ENV = os.environ.get('FLASK_ENV', 'production')
 IS_DEV = ENV == 'development'
@@ -21,15 +31,87 @@ class Config:
     # but for read-only static data, keep it in the app directory.
     DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
     INTERACTIONS_FILE = 'blog_interactions.json'
+    QUESTIONS_PER_PAGE = 15
+    # Token buckets: (burst capacity, tokens refilled per second) per client IP
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', '1') != '0'
+    RATE_LIMIT_DEFAULT = (120, 2.0)
+    RATE_LIMIT_EXPENSIVE = (20, 0.5)
+    MAX_CONCURRENT_EXPENSIVE = int(os.environ.get('MAX_CONCURRENT_EXPENSIVE', 4))
+    # Proxies in front of the app that append to X-Forwarded-For; 0 means the header
+    # is ignored, since a client talking to gunicorn directly can set it to anything.
+    # deploy.sh sets 1 for Cloud Run's front end.
+    TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+    # Run the typo-tolerant fallback when exact search finds fewer results than this
+    FUZZY_MIN_RESULTS = 3
+    RESULT_CACHE_MAX_BYTES = int(os.environ.get('RESULT_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+    RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 300))
+    # Parsed data files; pinned files are never evicted
+    DATA_CACHE_MAX_BYTES = int(os.environ.get('DATA_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+    DATA_CACHE_PINNED = os.environ.get(
+        'DATA_CACHE_PINNED', 'interview_questions.json,blog.json,blog_interactions.json'
+    ).split(',')
+    CHANGE_JOURNAL_MAX_ENTRIES = int(os.environ.get('CHANGE_JOURNAL_MAX_ENTRIES', 5000))
 
 app = Flask(__name__)
+app.json = codec.CodecJSONProvider(app)
 Compress(app)
 
 # 1. Permissive CORS for Debugging
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# Sitemap and search requests do far more work than a cached list or detail lookup.
+# Batch stays in the default class: pages load through it, and each item is an index lookup.
+limiter = RateLimiter(
+    app,
+    backend=backend_from_env(),
+    limits={'default': Config.RATE_LIMIT_DEFAULT, 'expensive': Config.RATE_LIMIT_EXPENSIVE},
+    route_classes={'expensive': ['sitemap_xml', 'search_interview_questions']},
+    concurrency={'expensive': Config.MAX_CONCURRENT_EXPENSIVE},
+    exempt=['health_check', 'index'],
+    trusted_proxies=Config.TRUSTED_PROXIES,
+    enabled=Config.RATE_LIMIT_ENABLED
+)
+
+result_cache = ResultCache(Config.RESULT_CACHE_MAX_BYTES, Config.RESULT_CACHE_TTL)
+
 interaction_lock = threading.Lock()
-_file_cache = {}
+_derived_cache = {}
+# Data file -> (mtime, (record, derived fields) pairs) from its compiled artifact
+_compiled_meta = {}
+
+def _drop_derived(filename):
+    """Forget derived structures built from a data file evicted from the cache."""
+    _compiled_meta.pop(filename, None)
+    for name, (_, _, filenames) in list(_derived_cache.items()):
+        if filename in filenames:
+            _derived_cache.pop(name, None)
+
+_file_cache = DataCache(
+    Config.DATA_CACHE_MAX_BYTES,
+    pinned=Config.DATA_CACHE_PINNED,
+    on_evict=_drop_derived
+)
+
+DATA_FILES = [
+    'blog.json', 'roadmaps.json', 'firms.json', 'interview_questions.json',
+    'resources.json', 'early_career.json', 'faq.json'
+]
+
+# URL collection name -> (data file, preferred lookup key)
+COLLECTIONS = {
+    'interview-questions': ('interview_questions.json', 'slug'),
+    'blog': ('blog.json', 'id'),
+    'firms': ('firms.json', 'id'),
+    'resources': ('resources.json', 'id'),
+    'early-career': ('early_career.json', 'id'),
+    'roadmaps': ('roadmaps.json', 'id'),
+}
+
+# Data file -> collection name used in the change feed
+change_feed = ChangeFeed(
+    dict({filename: name for name, (filename, _) in COLLECTIONS.items()}, **{'faq.json': 'faq'}),
+    max_entries=Config.CHANGE_JOURNAL_MAX_ENTRIES
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,20 +128,30 @@ def after_request(response):
 def get_file_path(filename):
     return os.path.join(Config.DATA_DIR, os.path.basename(filename))
 
-def make_slug(text, max_words=10):
-    """Generate URL-friendly slug from text."""
-    if not text:
-        return ""
-    text = unidecode.unidecode(text)
-    text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    words = text.split('-')
-    words = words[:max_words]
-    slug = "-".join(words)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip('-')
-    return slug
+def get_storage_path(filename):
+    """Path a data file is actually read from: its JSON Lines form when one exists."""
+    return jsonl_store.storage_path(get_file_path(filename))
+
+_jsonl_stores = {}
+_jsonl_lock = threading.Lock()
+
+def get_jsonl_store(filename):
+    """Open JsonlStore for a JSON Lines backed data file, reopened when the file changes.
+
+    Superseded stores are not closed explicitly, as other threads may still be
+    reading them; their mmaps are released once unreferenced.
+    """
+    path = jsonl_store.jsonl_path(get_file_path(filename))
+    stat = os.stat(path)
+    with _jsonl_lock:
+        store = _jsonl_stores.get(filename)
+        if store is None or (store.size, store.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            store = _jsonl_stores[filename] = jsonl_store.JsonlStore(path)
+        return store
+
+def read_source_records(filename):
+    """Records as stored on disk, bypassing the cache and compiled artifacts; for code that writes them back."""
+    return jsonl_store.read_records(get_storage_path(filename))
 
 def update_resources_with_slugs():
     # SKIP IN PRODUCTION to prevent Read-Only File System Errors
@@ -67,12 +159,8 @@ def update_resources_with_slugs():
         logger.info("Skipping resource slug update in production (Read-Only FS)")
         return
 
-    data_dir = 'data'
-    resources_file = os.path.join(data_dir, 'resources.json')
-    
     try:
-        with open(resources_file, 'r', encoding='utf-8') as f:
-            resources = json.load(f)
+        resources = read_source_records('resources.json')
         
         updated = False
         for resource in resources:
@@ -85,8 +173,7 @@ def update_resources_with_slugs():
                         updated = True
         
         if updated:
-            with open(resources_file, 'w', encoding='utf-8') as f:
-                json.dump(resources, f, indent=2)
+            save_json_safe('resources.json', resources)
             print(f"Updated {len(resources)} resources.")
     except Exception as e:
         logger.error(f"Error updating resource slugs: {e}")
@@ -97,12 +184,8 @@ def update_firms_with_slugs():
         logger.info("Skipping firm slug update in production (Read-Only FS)")
         return
 
-    data_dir = 'data'
-    firms_file = os.path.join(data_dir, 'firms.json')
-    
     try:
-        with open(firms_file, 'r', encoding='utf-8') as f:
-            firms = json.load(f)
+        firms = read_source_records('firms.json')
         
         updated = False
         seen_slugs = set()
@@ -125,8 +208,7 @@ def update_firms_with_slugs():
                     updated = True
         
         if updated:
-            with open(firms_file, 'w', encoding='utf-8') as f:
-                json.dump(firms, f, indent=2)
+            save_json_safe('firms.json', firms)
             print(f"Updated {len(firms)} firms with slugs")
     except Exception as e:
         logger.error(f"Error updating firm slugs: {e}")
@@ -137,12 +219,8 @@ def update_early_career_with_slugs():
         logger.info("Skipping early career slug update in production (Read-Only FS)")
         return
 
-    data_dir = 'data'
-    early_career_file = os.path.join(data_dir, 'early_career.json')
-    
     try:
-        with open(early_career_file, 'r', encoding='utf-8') as f:
-            early_career = json.load(f)
+        early_career = read_source_records('early_career.json')
         
         updated = False
         seen_slugs = set()
@@ -165,8 +243,7 @@ def update_early_career_with_slugs():
                     updated = True
         
         if updated:
-            with open(early_career_file, 'w', encoding='utf-8') as f:
-                json.dump(early_career, f, indent=2)
+            save_json_safe('early_career.json', early_career)
             print(f"Updated {len(early_career)} early career opportunities with slugs")
     except Exception as e:
         logger.error(f"Error updating early career slugs: {e}")
@@ -203,12 +280,8 @@ def update_questions_with_improved_slugs():
         logger.info("Skipping question slug update in production (Read-Only FS)")
         return
 
-    data_dir = 'data'
-    questions_file = os.path.join(data_dir, 'interview_questions.json')
-    
     try:
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
+        questions = read_source_records('interview_questions.json')
         
         updated = False
         seen_slugs = set()
@@ -232,17 +305,18 @@ def update_questions_with_improved_slugs():
                 logger.info(f"Generated slug: {slug} for question {question.get('id')}")
         
         if updated:
-            with open(questions_file, 'w', encoding='utf-8') as f:
-                json.dump(questions, f, indent=2)
+            save_json_safe('interview_questions.json', questions)
             print(f"Updated {len(questions)} questions with descriptive slugs")
     except Exception as e:
         logger.error(f"Error updating question slugs: {e}")
 
+_MISSING = object()
+
 def load_json_safe(filename, default=None):
     if default is None:
         default = []
     
-    filepath = get_file_path(filename)
+    filepath = get_storage_path(filename)
     if not os.path.exists(filepath):
         logger.warning(f"File not found: {filename}")
         return default
@@ -251,15 +325,23 @@ def load_json_safe(filename, default=None):
         stat = os.stat(filepath)
         mtime = stat.st_mtime
         
-        if filename in _file_cache:
-            cache_mtime, cache_data = _file_cache[filename]
-            if cache_mtime == mtime:
-                return cache_data
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            _file_cache[filename] = (mtime, data)
-            return data
+        cached = _file_cache.get(filename, mtime, default=_MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        compiled = compile_data.load_compiled(Config.DATA_DIR, filename, stat)
+        if compiled is not None:
+            data = compiled['data']
+            records = compile_data.records_of(data)
+            if len(records) == len(compiled['derived']):
+                _compiled_meta[filename] = (mtime, list(zip(records, compiled['derived'])))
+        elif filepath.endswith('.jsonl'):
+            data = get_jsonl_store(filename).load_all()
+        else:
+            data = codec.load_file(filepath)
+        change_feed.observe(filename, stat.st_mtime_ns, data)
+        _file_cache.put(filename, mtime, data)
+        return data
     except Exception as e:
         logger.error(f"Error reading {filename}: {e}")
         return default
@@ -267,15 +349,18 @@ def load_json_safe(filename, default=None):
 def save_json_safe(filename, data):
     # WARNING: This will fail in standard Cloud Run for persistent data
     # unless you mount a volume. For now, we catch the error.
-    filepath = get_file_path(filename)
+    filepath = get_storage_path(filename)
     tmp_path = filepath + '.tmp'
     try:
-        with open(tmp_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        os.replace(tmp_path, filepath)
+        if filepath.endswith('.jsonl'):
+            jsonl_store.write_jsonl(filepath, data)
+        else:
+            codec.dump_file(tmp_path, data)
+            os.replace(tmp_path, filepath)
         
         stat = os.stat(filepath)
-        _file_cache[filename] = (stat.st_mtime, data)
+        change_feed.observe(filename, stat.st_mtime_ns, data)
+        _file_cache.put(filename, stat.st_mtime, data)
     except OSError as e:
         if "Read-only file system" in str(e):
             logger.error(f"Cannot save {filename}: File system is read-only (Cloud Run)")
@@ -286,6 +371,66 @@ def save_json_safe(filename, data):
             os.remove(tmp_path)
         raise
 
+def data_version(*filenames):
+    """Return a tuple of file mtimes identifying the current state of the given data files."""
+    version = []
+    for filename in filenames:
+        try:
+            version.append(os.stat(get_storage_path(filename)).st_mtime)
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+def get_derived(name, filenames, builder):
+    """Return builder(*datasets) for the given files, rebuilt only when one of them changes."""
+    version = data_version(*filenames)
+    cached = _derived_cache.get(name)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    value = builder(*[load_json_safe(f, default=[]) for f in filenames])
+    _derived_cache[name] = (version, value, tuple(filenames))
+    return value
+
+def get_record_meta(filename):
+    """(record, precomputed fields) pairs for a data file, in file order (see compile_data.derive).
+
+    Each record is paired with its own fields, so callers never rely on the
+    order of the loaded list. Taken from the compiled artifact when the data
+    was loaded from one, otherwise derived here once per data version.
+    """
+    def build(data):
+        compiled = _compiled_meta.get(filename)
+        if compiled and compiled[0] == data_version(filename)[0]:
+            return compiled[1]
+        return [(record, compile_data.derive(filename, record)) for record in compile_data.records_of(data)]
+
+    return get_derived(f"meta:{filename}", [filename], build)
+
+def _build_record_index(data):
+    records = list(data.values()) if isinstance(data, dict) else data
+    by_id = {}
+    by_slug = {}
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        if record.get('id') is not None:
+            by_id.setdefault(str(record['id']), record)
+        if record.get('slug'):
+            by_slug.setdefault(record['slug'], record)
+    return by_id, by_slug
+
+def find_record(filename, identifier, prefer='id'):
+    """Look up a record by id or slug, trying the preferred key first."""
+    if get_storage_path(filename).endswith('.jsonl') and filename not in _file_cache:
+        # Decode just the one record rather than parsing the whole collection
+        return get_jsonl_store(filename).get(identifier, prefer=prefer)
+    by_id, by_slug = get_derived(f"index:{filename}", [filename], _build_record_index)
+    identifier = str(identifier)
+    if prefer == 'slug':
+        return by_slug.get(identifier) or by_id.get(identifier)
+    return by_id.get(identifier) or by_slug.get(identifier)
+
 def handle_errors(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -296,6 +441,46 @@ def handle_errors(f):
             return jsonify({"error": "Internal Server Error", "message": str(e)}), 500
     return decorated_function
 
+def cached_view(name, filenames, params=None, when=None, vary=None):
+    """Serve a view from result_cache, keyed by its normalized query parameters and data version.
+
+    params maps each query parameter that affects the result to a normalizer;
+    when() decides per request whether caching applies, and vary() adds extra
+    key parts. Only 200 responses are stored.
+    """
+    params = params or {}
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if when is not None and not when():
+                return f(*args, **kwargs)
+
+            key = (
+                name,
+                tuple(sorted(kwargs.items())),
+                tuple((p, normalize(request.args.get(p, ''))) for p, normalize in sorted(params.items())),
+                data_version(*filenames),
+                vary() if vary else None
+            )
+
+            def compute():
+                resp = make_response(f(*args, **kwargs))
+                headers = [(h, resp.headers[h]) for h in ('Cache-Control', 'X-Robots-Tag') if h in resp.headers]
+                return resp.status_code, resp.get_data(), resp.mimetype, headers
+
+            status, body, mimetype, headers = result_cache.get_or_compute(
+                key, compute, size_of=lambda v: len(v[1]), cacheable=lambda v: v[0] == 200
+            )
+            resp = Response(body, status=status, mimetype=mimetype)
+            resp.headers.extend(headers)
+            return resp
+        return wrapper
+    return decorator
+
+def _normalize_term(value):
+    return value.lower().strip()
+
 @app.route('/robots.txt')
 def robots_txt():
     lines = [
@@ -306,6 +491,7 @@ def robots_txt():
     return Response("\n".join(lines), mimetype="text/plain")
 
 @app.route('/sitemap.xml')
+@cached_view('sitemap', DATA_FILES, vary=lambda: datetime.utcnow().date())
 def sitemap_xml():
     MAX_URLS = 50000
     MAX_BYTES = 49 * 1024 * 1024
@@ -336,39 +522,8 @@ def sitemap_xml():
         if full_url in seen_urls: return
         seen_urls.add(full_url)
 
-        final_date = SERVER_START_TIME 
-        if lastmod:
-            try:
-                if isinstance(lastmod, str):
-                    # Try multiple date formats
-                    try:
-                        parsed_date = datetime.fromisoformat(lastmod.replace('Z', '+00:00')).date()
-                    except ValueError:
-                        try:
-                            # Try common date string formats
-                            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']:
-                                try:
-                                    parsed_date = datetime.strptime(lastmod.split('T')[0], fmt).date()
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                parsed_date = datetime.utcnow().date()
-                        except Exception:
-                            parsed_date = datetime.utcnow().date()
-                elif isinstance(lastmod, (datetime, date)):
-                    parsed_date = lastmod if isinstance(lastmod, date) else lastmod.date()
-                else:
-                    parsed_date = datetime.utcnow().date()
-                
-                today = datetime.utcnow().date()
-                if parsed_date > today:
-                    parsed_date = today
-                
-                final_date = parsed_date.isoformat()
-            except Exception:
-                # If any date parsing fails, use server start time
-                final_date = SERVER_START_TIME
+        # lastmod values are ISO dates (normalized by compile_data); never in the future
+        final_date = min(str(lastmod)[:10], SERVER_START_TIME) if lastmod else SERVER_START_TIME
 
         loc_xml = html.escape(full_url)
         entry = (
@@ -403,66 +558,29 @@ def sitemap_xml():
         add_entry(path, lastmod=SERVER_START_TIME, priority=prio, changefreq=freq)
 
     # Blog posts
-    posts = load_json_safe('blog.json')
-    if isinstance(posts, list):
-        for post in posts:
-            if post.get('id'):
-                add_entry(
-                    f"/blog/{post['id']}", 
-                    lastmod=post.get('date'), 
-                    priority='0.5', 
-                    changefreq='monthly'
-                )
+    for _, meta in get_record_meta('blog.json'):
+        if meta['path']:
+            add_entry(meta['path'], lastmod=meta['lastmod'], priority='0.5', changefreq='monthly')
 
     # Roadmaps
-    roadmaps = load_json_safe('roadmaps.json')
-    r_list = list(roadmaps.values()) if isinstance(roadmaps, dict) else roadmaps
-    if isinstance(r_list, list):
-        for r in r_list:
-            if r.get('id'):
-                add_entry(
-                    f"/roadmaps/{r['id']}", 
-                    lastmod=r.get('updated_at') or r.get('date') or SERVER_START_TIME,
-                    priority='0.7', 
-                    changefreq='weekly'
-                )
+    for _, meta in get_record_meta('roadmaps.json'):
+        if meta['path']:
+            add_entry(meta['path'], lastmod=meta['lastmod'], priority='0.7', changefreq='weekly')
 
     # Firms
-    firms = load_json_safe('firms.json')
-    f_list = list(firms.values()) if isinstance(firms, dict) else firms
-    if isinstance(f_list, list):
-        for f in f_list:
-            if f.get('id'):
-                add_entry(
-                    f"/firms/{f['id']}", 
-                    lastmod=f.get('updated_at') or SERVER_START_TIME,
-                    priority='0.5', 
-                    changefreq='monthly'
-                )
+    for _, meta in get_record_meta('firms.json'):
+        if meta['path']:
+            add_entry(meta['path'], lastmod=meta['lastmod'], priority='0.5', changefreq='monthly')
     
     # Interview Questions - individual questions with slugs
-    questions = load_json_safe('interview_questions.json')
-    if isinstance(questions, list):
-        # Add ALL questions to sitemap
-        for question in questions:
-            if question.get('slug'):
-                # Generate full URL
-                slug = question.get('slug')
-                if not slug:
-                    # Generate slug if missing
-                    slug = generate_question_slug(question)
-                    question['slug'] = slug
-                
-                add_entry(
-                    f"/interview-questions/{slug}", 
-                    lastmod=SERVER_START_TIME,
-                    priority='0.6', 
-                    changefreq='monthly'
-                )
+    question_meta = get_record_meta('interview_questions.json')
+    for _, meta in question_meta:
+        if meta['path']:
+            add_entry(meta['path'], lastmod=SERVER_START_TIME, priority='0.6', changefreq='monthly')
         
     # Also add paginated views for better crawling
-    total_questions = len(questions)
-    questions_per_page = 15
+    total_questions = len(question_meta)
+    questions_per_page = Config.QUESTIONS_PER_PAGE
     total_pages = (total_questions + questions_per_page - 1) // questions_per_page
     
     for page in range(1, total_pages + 1):
@@ -474,76 +592,21 @@ def sitemap_xml():
         )
     
     # Resources - ALL resources including PDFs
-    resources = load_json_safe('resources.json')
-    if isinstance(resources, list):
-        for resource in resources:
-            slug = resource.get('slug')
-            if not slug:
-                # Generate slug from title if not present
-                title = resource.get('title', '')
-                if title:
-                    slug = make_slug(title[:80])
-                if not slug and resource.get('id'):
-                    slug = f"resource-{resource.get('id')}"
-                if not slug:
-                    continue  # Skip if we can't create a slug
-            
-            # Determine if it's a PDF resource
-            is_pdf = False
-            resource_type = str(resource.get('type', '')).lower()
-            filename = str(resource.get('filename', '')).lower()
-            
-            if 'pdf' in resource_type or filename.endswith('.pdf'):
-                is_pdf = True
-            # Also check link for PDF
-            elif 'link' in resource:
-                link = str(resource.get('link', '')).lower()
-                if '.pdf' in link or 'pdf' in link:
-                    is_pdf = True
-            
-            # Set priority: low for PDFs (0.3), medium for others (0.6)
-            priority = '0.0' if is_pdf else '0.6'
-            
-            # Get the best available date
-            resource_date = None
-            for date_field in ['date', 'updated_at', 'created_at', 'published_date']:
-                if resource.get(date_field):
-                    resource_date = resource.get(date_field)
-                    break
-            
-            add_entry(
-                f"/resources/{slug}", 
-                lastmod=resource_date or SERVER_START_TIME,
-                priority=priority, 
-                changefreq='monthly'
-            )
+    for _, meta in get_record_meta('resources.json'):
+        if meta['path']:
+            # Set priority: low for PDFs, medium for others
+            priority = '0.0' if meta['is_pdf'] else '0.6'
+            add_entry(meta['path'], lastmod=meta['lastmod'], priority=priority, changefreq='monthly')
     
     # Add early career pages if they exist
-    early_career = load_json_safe('early_career.json')
-    if isinstance(early_career, list):
-        for item in early_career:
-            if item.get('id'):
-                add_entry(
-                    f"/early-career/{item['id']}",
-                    lastmod=SERVER_START_TIME,
-                    priority='0.7',
-                    changefreq='monthly'
-                )
+    for _, meta in get_record_meta('early_career.json'):
+        if meta['path']:
+            add_entry(meta['path'], lastmod=SERVER_START_TIME, priority='0.7', changefreq='monthly')
     
     # FAQ entries if they have individual pages
-    faq = load_json_safe('faq.json')
-    if isinstance(faq, list):
-        for faq_item in faq:
-            if faq_item.get('id'):
-                # Check if FAQ has a slug or can have individual page
-                slug = faq_item.get('slug')
-                if slug:
-                    add_entry(
-                        f"/faq/{slug}",
-                        lastmod=SERVER_START_TIME,
-                        priority='0.4',
-                        changefreq='yearly'
-                    )
+    for _, meta in get_record_meta('faq.json'):
+        if meta['path']:
+            add_entry(meta['path'], lastmod=SERVER_START_TIME, priority='0.4', changefreq='yearly')
 
     full_content = "\n".join(xml_header + xml_body + ['</urlset>'])
     resp = Response(full_content, mimetype="application/xml")
@@ -562,6 +625,15 @@ def health_check():
         'timestamp': datetime.utcnow().isoformat() + 'Z'
     })
     
+@app.route('/api/metrics', methods=['GET'])
+@handle_errors
+def metrics():
+    return jsonify({
+        'result_cache': result_cache.stats(),
+        'data_cache': _file_cache.stats(),
+        'rate_limit': dict(limiter.stats, in_flight_expensive=limiter.in_flight('expensive'))
+    })
+
 @app.route('/api/early-career', methods=['GET'])
 @handle_errors
 def get_early_career():
@@ -569,9 +641,54 @@ def get_early_career():
     resp.headers['Cache-Control'] = 'public, max-age=3600'
     return resp
 
+def _is_roadmap_section(value):
+    return isinstance(value, list) and bool(value) and all(isinstance(v, dict) for v in value)
+
+def _build_roadmap_sections(data):
+    """Precompute lightweight roadmap summaries and each section's byte offsets.
+
+    Every top-level list of objects in a roadmap (schools, skills, roadmap_steps, ...)
+    is a section. Sections are serialized once into a single buffer per roadmap so a
+    section request only slices bytes.
+    """
+    summaries = []
+    sections = {}
+    records = list(data.values()) if isinstance(data, dict) else data
+    for roadmap in records:
+        if not isinstance(roadmap, dict) or roadmap.get('id') is None:
+            continue
+        keys = [k for k, v in roadmap.items() if _is_roadmap_section(v)]
+
+        chunks = []
+        offsets = []
+        position = 0
+        for index, key in enumerate(keys):
+            chunk = codec.dumps({
+                'roadmap_id': roadmap['id'],
+                'index': index,
+                'key': key,
+                'count': len(roadmap[key]),
+                'items': roadmap[key]
+            })
+            offsets.append((position, len(chunk), hashlib.sha1(chunk).hexdigest()))
+            chunks.append(chunk)
+            position += len(chunk)
+
+        summary = {k: v for k, v in roadmap.items() if k not in keys}
+        summary['section_count'] = len(keys)
+        summary['sections'] = [
+            {'index': i, 'key': k, 'count': len(roadmap[k])} for i, k in enumerate(keys)
+        ]
+        summaries.append(summary)
+        sections[str(roadmap['id'])] = (b''.join(chunks), offsets)
+    return summaries, sections
+
 @app.route('/api/roadmaps', methods=['GET'])
 @handle_errors
 def get_roadmaps():
+    if request.args.get('view') == 'summary':
+        return get_roadmap_summaries()
+
     data = load_json_safe('roadmaps.json')
     if isinstance(data, dict):
         data = list(data.values())
@@ -579,18 +696,43 @@ def get_roadmaps():
     resp.headers['Cache-Control'] = 'public, max-age=3600'
     return resp
 
+# Same as ?view=summary; a path-based URL can be served from the static export
+@app.route('/api/roadmaps/summary', methods=['GET'])
+@handle_errors
+def get_roadmap_summaries():
+    summaries, _ = get_derived('roadmap_sections', ['roadmaps.json'], _build_roadmap_sections)
+    resp = make_response(jsonify(summaries))
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
+
 @app.route('/api/roadmaps/<roadmap_id>', methods=['GET'])
 @handle_errors
 def get_roadmap(roadmap_id):
-    data = load_json_safe('roadmaps.json')
-    data_list = list(data.values()) if isinstance(data, dict) else data
-    item = next((r for r in data_list if str(r.get('id')) == str(roadmap_id)), None)
+    item = find_record('roadmaps.json', roadmap_id)
     if item:
         resp = make_response(jsonify(item))
         resp.headers['Cache-Control'] = 'public, max-age=3600'
         return resp
     return jsonify({'error': 'Roadmap not found'}), 404
 
+@app.route('/api/roadmaps/<roadmap_id>/sections/<int:index>', methods=['GET'])
+@handle_errors
+def get_roadmap_section(roadmap_id, index):
+    _, sections = get_derived('roadmap_sections', ['roadmaps.json'], _build_roadmap_sections)
+    entry = sections.get(str(roadmap_id))
+    if not entry:
+        return jsonify({'error': 'Roadmap not found'}), 404
+
+    blob, offsets = entry
+    if index < 0 or index >= len(offsets):
+        return jsonify({'error': 'Section not found'}), 404
+
+    start, length, digest = offsets[index]
+    resp = Response(blob[start:start + length], mimetype='application/json')
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    resp.set_etag(digest)
+    return resp.make_conditional(request)
+
 @app.route('/api/firms', methods=['GET'])
 @handle_errors
 def get_firms():
@@ -622,15 +764,18 @@ def get_blog_posts():
         post['likes'] = interactions.get(pid, {}).get('likes', 0)
     return jsonify(posts)
 
+def get_rendered_post(post):
+    """Rendered HTML, TOC and reading time for a post, computed once per blog.json mtime."""
+    rendered = get_derived('blog_rendered', ['blog.json'], lambda posts: {})
+    key = str(post.get('id'))
+    if key not in rendered:
+        rendered[key] = render_post(post)
+    return rendered[key]
+
 @app.route('/api/blog/<identifier>', methods=['GET'])
 @handle_errors
 def get_blog_post(identifier):
-    posts = load_json_safe('blog.json')
-    
-    post = next(
-        (p for p in posts if str(p.get('id')) == str(identifier) or p.get('slug') == identifier),
-        None
-    )
+    post = find_record('blog.json', identifier)
     
     if not post:
         return jsonify({'error': 'Post not found'}), 404
@@ -638,6 +783,12 @@ def get_blog_post(identifier):
     interactions = load_json_safe(Config.INTERACTIONS_FILE, default={})
     post['likes'] = interactions.get(str(post['id']), {}).get('likes', 0)
 
+    if request.args.get('format') == 'html':
+        rendered = get_rendered_post(post)
+        payload = {k: v for k, v in post.items() if k != 'content'}
+        payload.update(rendered)
+        return jsonify(payload)
+
     return jsonify(post)
 
 
@@ -671,22 +822,38 @@ def unlike_post(post_id):
 @app.route('/api/interview-questions', methods=['GET'])
 @handle_errors
 def get_interview_questions():
+    page = request.args.get('page', type=int)
+    if page is not None:
+        return get_interview_questions_page(page)
+    resp = make_response(jsonify(load_json_safe('interview_questions.json')))
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
+
+# Same as ?page=N; a path-based URL can be served from the static export
+@app.route('/api/interview-questions/page/<int:page>', methods=['GET'])
+@handle_errors
+def get_interview_questions_page(page):
     data = load_json_safe('interview_questions.json')
-    resp = make_response(jsonify(data))
+    per_page = Config.QUESTIONS_PER_PAGE
+    total_pages = (len(data) + per_page - 1) // per_page
+    if page < 1 or page > max(total_pages, 1):
+        return jsonify({'error': 'Page out of range'}), 404
+    start = (page - 1) * per_page
+    resp = make_response(jsonify({
+        'page': page,
+        'per_page': per_page,
+        'total': len(data),
+        'total_pages': total_pages,
+        'results': data[start:start + per_page]
+    }))
     resp.headers['Cache-Control'] = 'public, max-age=3600'
     return resp
 
 @app.route('/api/interview-questions/<identifier>', methods=['GET'])
 @handle_errors
 def get_interview_question(identifier):
-    data = load_json_safe('interview_questions.json')
-    
-    # Try to find by slug first
-    question = next((q for q in data if q.get('slug') == identifier), None)
-    
-    # If not found by slug, try by ID
-    if not question:
-        question = next((q for q in data if str(q.get('id')) == str(identifier)), None)
+    # Try to find by slug first, then by ID
+    question = find_record('interview_questions.json', identifier, prefer='slug')
     
     if question:
         resp = make_response(jsonify(question))
@@ -701,14 +868,8 @@ def index():
 @app.route('/api/resources/<resource_id>', methods=['GET'])
 @handle_errors
 def get_resource(resource_id):
-    resources = load_json_safe('resources.json')
-    
-    # Try to find by id first
-    resource = next((r for r in resources if str(r.get('id')) == str(resource_id)), None)
-    
-    # If not found by id, try by slug
-    if not resource:
-        resource = next((r for r in resources if r.get('slug') == resource_id), None)
+    # Try to find by id first, then by slug
+    resource = find_record('resources.json', resource_id)
     
     if resource:
         resp = make_response(jsonify(resource))
@@ -719,14 +880,8 @@ def get_resource(resource_id):
 @app.route('/api/resources/slug/<slug>', methods=['GET'])
 @handle_errors
 def get_resource_by_slug(slug):
-    resources = load_json_safe('resources.json')
-    
-    # 1. Try to find by exact slug match
-    resource = next((r for r in resources if r.get('slug') == slug), None)
-    
-    # 2. Fallback: If not found, check if 'slug' param is actually an ID
-    if not resource:
-        resource = next((r for r in resources if str(r.get('id')) == str(slug)), None)
+    # Exact slug match, falling back to treating 'slug' as an ID
+    resource = find_record('resources.json', slug, prefer='slug')
 
     if resource:
         resp = make_response(jsonify(resource))
@@ -766,12 +921,8 @@ def download_resource(filename):
 @app.route('/api/firms/slug/<slug>', methods=['GET'])
 @handle_errors
 def get_firm_by_slug(slug):
-    firms = load_json_safe('firms.json')
-    firm = next((f for f in firms if f.get('slug') == slug), None)
-    
-    if not firm:
-        # Fallback: try by ID
-        firm = next((f for f in firms if str(f.get('id')) == str(slug)), None)
+    # Fallback: try by ID
+    firm = find_record('firms.json', slug, prefer='slug')
     
     if firm:
         resp = make_response(jsonify(firm))
@@ -782,12 +933,8 @@ def get_firm_by_slug(slug):
 @app.route('/api/early-career/slug/<slug>', methods=['GET'])
 @handle_errors
 def get_early_career_by_slug(slug):
-    opportunities = load_json_safe('early_career.json')
-    opportunity = next((o for o in opportunities if o.get('slug') == slug), None)
-    
-    if not opportunity:
-        # Fallback: try by ID
-        opportunity = next((o for o in opportunities if str(o.get('id')) == str(slug)), None)
+    # Fallback: try by ID
+    opportunity = find_record('early_career.json', slug, prefer='slug')
     
     if opportunity:
         resp = make_response(jsonify(opportunity))
@@ -798,11 +945,7 @@ def get_early_career_by_slug(slug):
 @app.route('/api/firms/<firm_id>', methods=['GET'])
 @handle_errors
 def get_firm(firm_id):
-    firms = load_json_safe('firms.json')
-    firm = next((f for f in firms if str(f.get('id')) == str(firm_id)), None)
-    
-    if not firm:
-        firm = next((f for f in firms if f.get('slug') == firm_id), None)
+    firm = find_record('firms.json', firm_id)
     
     if firm:
         resp = make_response(jsonify(firm))
@@ -813,11 +956,7 @@ def get_firm(firm_id):
 @app.route('/api/early-career/<opportunity_id>', methods=['GET'])
 @handle_errors
 def get_early_career_opportunity(opportunity_id):
-    opportunities = load_json_safe('early_career.json')
-    opportunity = next((o for o in opportunities if str(o.get('id')) == str(opportunity_id)), None)
-    
-    if not opportunity:
-        opportunity = next((o for o in opportunities if o.get('slug') == opportunity_id), None)
+    opportunity = find_record('early_career.json', opportunity_id)
     
     if opportunity:
         resp = make_response(jsonify(opportunity))
@@ -827,6 +966,10 @@ def get_early_career_opportunity(opportunity_id):
 
 @app.route('/api/interview-questions/search', methods=['GET'])
 @handle_errors
+@cached_view(
+    'search', ['interview_questions.json'],
+    params={'q': _normalize_term, 'category': _normalize_term, 'difficulty': _normalize_term, 'limit': str.strip}
+)
 def search_interview_questions():
     """Search questions with advanced filtering"""
     try:
@@ -838,74 +981,107 @@ def search_interview_questions():
         difficulty = request.args.get('difficulty', '').lower().strip()
         limit = int(request.args.get('limit', 20))
         
-        filtered_questions = []
+        question_meta = get_record_meta('interview_questions.json')
+        matches = []
         
-        for question in questions:
+        for question, meta in question_meta:
             # Filter by category
-            if category and question.get('category', '').lower() != category:
+            if category and meta['category'] != category:
                 continue
             
             # Filter by difficulty
-            if difficulty and question.get('difficulty', '').lower() != difficulty:
+            if difficulty and meta['difficulty'] != difficulty:
                 continue
             
             # Filter by search term
-            if search_term:
-                search_fields = [
-                    question.get('question', ''),
-                    question.get('approach', ''),
-                    question.get('answer', ''),
-                    ' '.join(question.get('tags', [])),
-                    ' '.join(question.get('key_concepts', [])),
-                    question.get('firm', '')
-                ]
-                
-                search_text = ' '.join(str(field) for field in search_fields).lower()
-                if search_term not in search_text:
-                    continue
+            if search_term and search_term not in meta['search_text']:
+                continue
             
-            filtered_questions.append(question)
+            matches.append((question, meta))
         
         # Sort by relevance (simple implementation)
         if search_term:
-            def relevance_score(q):
+            def relevance_score(match):
+                meta = match[1]
                 score = 0
-                if search_term in q.get('question', '').lower():
+                if search_term in meta['question']:
                     score += 3
-                if search_term in q.get('answer', '').lower():
+                if search_term in meta['answer']:
                     score += 2
-                if search_term in ' '.join(q.get('tags', [])).lower():
+                if search_term in meta['tags']:
                     score += 1
                 return score
             
-            filtered_questions.sort(key=relevance_score, reverse=True)
+            matches.sort(key=relevance_score, reverse=True)
+        filtered_questions = [question for question, _ in matches]
         
+        # Typo-tolerant fallback when the exact match finds (almost) nothing
+        corrected_query = None
+        exact_count = len(filtered_questions)
+        if search_term and len(filtered_questions) < Config.FUZZY_MIN_RESULTS:
+            index = get_derived('trigram', ['interview_questions.json'], TrigramIndex)
+            fuzzy_matches, corrected_query = index.search(search_term)
+            meta_by_question = {id(q): m for q, m in question_meta}
+            found = {id(q) for q in filtered_questions}
+            for question in fuzzy_matches:
+                meta = meta_by_question.get(id(question))
+                if meta is None or id(question) in found:
+                    continue
+                if category and meta['category'] != category:
+                    continue
+                if difficulty and meta['difficulty'] != difficulty:
+                    continue
+                filtered_questions.append(question)
+                found.add(id(question))
+
         # Limit results
         limited_results = filtered_questions[:limit]
         
-        return jsonify({
+        result = {
             'count': len(filtered_questions),
             'results': limited_results,
             'total': len(questions)
-        })
+        }
+        # Only report a correction that changed the query and found something new
+        if (corrected_query and len(filtered_questions) > exact_count
+                and corrected_query != normalize_search_text(search_term)):
+            result['fuzzy'] = True
+            result['corrected_query'] = corrected_query
+        return jsonify(result)
         
     except Exception as e:
         logger.error(f"Error searching questions: {e}")
         return jsonify({'error': 'Search failed', 'details': str(e)}), 500
     
+def get_questions_by_id():
+    """Questions sorted by id: a stable order for seeded sampling, whatever the file order."""
+    return get_derived(
+        'questions_by_id', ['interview_questions.json'],
+        lambda data: sorted(data, key=lambda q: str(q.get('id')))
+    )
+
 @app.route('/api/interview-questions/random', methods=['GET'])
 @handle_errors
+@cached_view(
+    'random', ['interview_questions.json'],
+    params={'count': str.strip, 'seed': str.strip}, when=lambda: 'seed' in request.args
+)
 def get_random_questions():
-    """Get fully random questions (not just same topic)."""
+    """Get fully random questions (not just same topic).
+
+    With ?seed= the selection is deterministic, so it can be cached and shared.
+    """
     count = request.args.get('count', default=4, type=int)
-    data = load_json_safe('interview_questions.json')
     
-    # Shuffle all questions
     import random
-    random.shuffle(data)
-    
-    # Return requested number
-    random_questions = data[:count]
+    seed = request.args.get('seed')
+    if seed is not None:
+        data = get_questions_by_id()
+        random_questions = random.Random(seed.strip()).sample(data, max(0, min(count, len(data))))
+    else:
+        # Sample rather than shuffle: the loaded list is shared and must keep file order
+        data = load_json_safe('interview_questions.json')
+        random_questions = random.sample(data, max(0, min(count, len(data))))
     
     # Format response to match what frontend expects
     for q in random_questions:
@@ -919,25 +1095,299 @@ def get_random_questions():
 
 @app.route('/api/interview-questions/random/<current_slug>', methods=['GET'])
 @handle_errors
+@cached_view(
+    'random_excluding', ['interview_questions.json'],
+    params={'count': str.strip, 'seed': str.strip}, when=lambda: 'seed' in request.args
+)
 def get_random_questions_excluding_current(current_slug):
     """Get random questions excluding the current one."""
     count = request.args.get('count', default=4, type=int)
-    data = load_json_safe('interview_questions.json')
+    
+    import random
+    seed = request.args.get('seed')
+    if seed is not None:
+        data = get_questions_by_id()
+    else:
+        data = load_json_safe('interview_questions.json')
     
     # Filter out current question
     filtered = [q for q in data if q.get('slug') != current_slug]
     
-    # Shuffle remaining questions
-    import random
-    random.shuffle(filtered)
-    
-    # Return requested number
-    random_questions = filtered[:count]
+    if seed is not None:
+        random_questions = random.Random(seed.strip()).sample(filtered, max(0, min(count, len(filtered))))
+    else:
+        random_questions = random.sample(filtered, max(0, min(count, len(filtered))))
     
     resp = make_response(jsonify(random_questions))
     resp.headers['Cache-Control'] = 'public, max-age=300'
     return resp
 
+@app.route('/api/suggest', methods=['GET'])
+@handle_errors
+def suggest():
+    """Typeahead suggestions for the search box, ranked by popularity."""
+    query = request.args.get('q', '')
+    limit = min(max(request.args.get('limit', default=8, type=int), 1), 10)
+    index = get_derived(
+        'suggest',
+        ['interview_questions.json', 'firms.json', 'blog.json', 'resources.json'],
+        build_suggest_index
+    )
+    suggestions = [
+        {k: v for k, v in entry.items() if k != 'weight' and v is not None}
+        for entry in index.suggest(query, limit)
+    ]
+    resp = make_response(jsonify({'query': query, 'suggestions': suggestions}))
+    resp.headers['Cache-Control'] = 'public, max-age=300'
+    return resp
+
+@app.route('/api/changes', methods=['GET'])
+@handle_errors
+def get_changes():
+    """Record-level changes since a version previously returned by this endpoint.
+
+    Versions are decimal strings (nanosecond mtimes don't fit a JS number);
+    pass one back unchanged as ?since=. Collections listed in 'resync'
+    changed further back than the journal reaches and must be re-fetched in
+    full; without ?since= every collection is listed.
+    """
+    # Loading picks up any file that changed since the last request
+    for filename in change_feed.collections:
+        load_json_safe(filename)
+
+    since = request.args.get('since', type=int)
+    if since is None:
+        payload = {
+            'version': str(change_feed.current_version()),
+            'changes': [],
+            'resync': sorted(change_feed.collections.values())
+        }
+    else:
+        version, changes, resync = change_feed.changes_since(since)
+        changes = [dict(change, version=str(change['version'])) for change in changes]
+        payload = {'version': str(version), 'changes': changes, 'resync': resync}
+
+    resp = make_response(jsonify(payload))
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
+
+# Collection -> (data file, shard key) for the content-addressed bundles
+BUNDLED_COLLECTIONS = {
+    'interview-questions': ('interview_questions.json', bundles.by_category),
+    'resources': ('resources.json', bundles.by_category),
+    'firms': ('firms.json', bundles.by_category),
+    'blog': ('blog.json', bundles.by_year),
+}
+
+def _build_bundles(*datasets):
+    specs = {}
+    for (collection, (_, shard_of)), data in zip(BUNDLED_COLLECTIONS.items(), datasets):
+        specs[collection] = (list(data.values()) if isinstance(data, dict) else data, shard_of)
+    return bundles.build_bundles(specs)
+
+def get_bundles():
+    filenames = [filename for filename, _ in BUNDLED_COLLECTIONS.values()]
+    return get_derived('bundles', filenames, _build_bundles)
+
+@app.route('/api/bundles/manifest', methods=['GET'])
+@handle_errors
+def get_bundle_manifest():
+    """Current shard URLs and hashes; revalidated on every use, answered with 304 when unchanged."""
+    manifest, _ = get_bundles()
+    resp = make_response(jsonify(manifest))
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.set_etag(manifest['version'])
+    return resp.make_conditional(request)
+
+@app.route('/api/bundles/<collection>/<file_name>', methods=['GET'])
+@handle_errors
+def get_bundle_shard(collection, file_name):
+    _, blobs = get_bundles()
+    body = blobs.get((collection, file_name))
+    if body is None:
+        # Unknown or superseded hash: the client should re-read the manifest
+        return jsonify({'error': 'Shard not found'}), 404
+
+    resp = Response(body, mimetype='application/json')
+    resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    resp.set_etag(file_name.rsplit('.', 2)[1])
+    return resp.make_conditional(request)
+
+MAX_BATCH_ITEMS = 200
+MAX_BATCH_RANDOM = 20
+
+def _split_param(value, name='value'):
+    """Comma-separated string or list -> list of strings; ValueError for any other type."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        if not all(isinstance(v, (str, int)) and not isinstance(v, bool) for v in value):
+            raise ValueError(f"'{name}' must be a list of strings")
+        return [str(v) for v in value if str(v)]
+    if not isinstance(value, str):
+        raise ValueError(f"'{name}' must be a string or a list")
+    return [v for v in value.split(',') if v]
+
+def _resolve_batch_request(spec, interactions):
+    """Resolve one {collection, ids, slugs, fields, random, exclude} spec.
+
+    Found records are keyed by the identifier under the lookup that found
+    them ('ids' or 'slugs'), so the same string in both never collides.
+    """
+    collection = spec.get('collection')
+    if not isinstance(collection, str) or collection not in COLLECTIONS:
+        raise ValueError(f"Unknown collection: {collection}")
+    filename, prefer = COLLECTIONS[collection]
+    fields = _split_param(spec.get('fields'), 'fields')
+
+    def project(record):
+        if fields:
+            record = {k: record[k] for k in fields if k in record}
+        else:
+            record = dict(record)
+        if collection == 'blog' and (not fields or 'likes' in fields):
+            record['likes'] = interactions.get(str(record.get('id')), {}).get('likes', 0)
+        return record
+
+    items = {'ids': {}, 'slugs': {}}
+    missing = {'ids': [], 'slugs': []}
+    for key, lookup_prefer in (('ids', 'id'), ('slugs', 'slug')):
+        for identifier in _split_param(spec.get(key), key):
+            record = find_record(filename, identifier, prefer=lookup_prefer)
+            if record is None:
+                missing[key].append(identifier)
+            else:
+                items[key][identifier] = project(record)
+
+    result = {'collection': collection, 'items': items, 'missing': missing}
+
+    try:
+        random_count = min(int(spec.get('random') or 0), MAX_BATCH_RANDOM)
+    except (TypeError, ValueError):
+        raise ValueError("'random' must be an integer")
+    exclude = spec.get('exclude') or ''
+    if not isinstance(exclude, (str, int)):
+        raise ValueError("'exclude' must be a string")
+    if random_count > 0:
+        import random
+        data = load_json_safe(filename)
+        records = list(data.values()) if isinstance(data, dict) else data
+        exclude = str(exclude)
+        pool = [r for r in records if not exclude or (r.get('slug') != exclude and str(r.get('id')) != exclude)]
+        result['random'] = [project(r) for r in random.sample(pool, min(random_count, len(pool)))]
+
+    return result
+
+@app.route('/api/batch', methods=['GET', 'POST'])
+@handle_errors
+def batch_get():
+    """Resolve many ids/slugs (and optional random picks) across collections in one request.
+
+    GET  /api/batch?collection=firms&ids=a,b&slugs=c&fields=id,name
+    POST /api/batch {"requests": [{"collection": "interview-questions", "slugs": [...],
+                                   "fields": [...], "random": 4, "exclude": "<slug>"}]}
+
+    Each result holds items/missing split by lookup: {"ids": {...}, "slugs": {...}}.
+    """
+    if request.method == 'POST':
+        payload = request.get_json(silent=True) or {}
+        specs = payload.get('requests')
+        if not isinstance(specs, list):
+            return jsonify({'error': "Body must contain a 'requests' list"}), 400
+    else:
+        specs = [request.args.to_dict()]
+
+    try:
+        total = sum(len(_split_param(s.get('ids'), 'ids')) + len(_split_param(s.get('slugs'), 'slugs'))
+                    for s in specs if isinstance(s, dict))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if total > MAX_BATCH_ITEMS:
+        return jsonify({'error': f"Too many items requested (max {MAX_BATCH_ITEMS})"}), 400
+
+    interactions = load_json_safe(Config.INTERACTIONS_FILE, default={})
+    results = []
+    for spec in specs:
+        if not isinstance(spec, dict):
+            return jsonify({'error': 'Each request must be an object'}), 400
+        try:
+            results.append(_resolve_batch_request(spec, interactions))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+    resp = make_response(jsonify({'results': results}))
+    if request.method == 'GET':
+        resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
+
+# --- Aggregate statistics ---
+
+def _stats_file(collection):
+    return 'faq.json' if collection == 'faq' else COLLECTIONS[collection][0]
+
+def _as_records(data):
+    return list(data.values()) if isinstance(data, dict) else data
+
+def _serialized(payload):
+    """(JSON body, ETag) for a payload, computed together so both are cached."""
+    body = codec.dumps(payload)
+    return body, hashlib.sha1(body).hexdigest()
+
+def _stats_body(collection=None, fields=None):
+    """Serialized aggregates and ETag for one or all collections, built once per data version."""
+    names = [collection] if collection else list(stats.STAT_FIELDS)
+
+    def build(*datasets):
+        payload = {
+            name: stats.summarize(_as_records(data), fields or stats.STAT_FIELDS[name])
+            for name, data in zip(names, datasets)
+        }
+        return _serialized(payload[collection] if collection else payload)
+
+    key = f"stats:{collection or '*'}:{','.join(fields or ())}"
+    return get_derived(key, [_stats_file(n) for n in names], build)
+
+def _crosstab_body(collection, row_field, column_field):
+    def build(data):
+        return _serialized(stats.crosstab(_as_records(data), row_field, column_field))
+
+    return get_derived(
+        f"stats:{collection}:{row_field}:{column_field}", [_stats_file(collection)], build
+    )
+
+@app.route('/api/stats', methods=['GET'])
+@handle_errors
+def get_stats():
+    """Counts per field for every collection, or one collection, or a cross-tab of two fields.
+
+    GET /api/stats
+    GET /api/stats?collection=interview-questions&fields=category,difficulty
+    GET /api/stats?collection=interview-questions&crosstab=firm,difficulty
+    """
+    collection = request.args.get('collection')
+    if collection and collection not in stats.STAT_FIELDS:
+        return jsonify({'error': f"Unknown collection: {collection}"}), 400
+
+    allowed = stats.STAT_FIELDS.get(collection, ())
+    fields = _split_param(request.args.get('fields'), 'fields')
+    crosstab = _split_param(request.args.get('crosstab'), 'crosstab')
+    if (fields or crosstab) and not collection:
+        return jsonify({'error': 'fields and crosstab require a collection'}), 400
+    if not all(f in allowed for f in fields + crosstab):
+        return jsonify({'error': f"Unknown field for {collection}", 'fields': list(allowed)}), 400
+
+    if crosstab:
+        if len(crosstab) != 2:
+            return jsonify({'error': 'crosstab takes two comma-separated fields'}), 400
+        body, etag = _crosstab_body(collection, *crosstab)
+    else:
+        body, etag = _stats_body(collection, tuple(dict.fromkeys(fields)) or None)
+
+    resp = Response(body, mimetype='application/json')
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
+
 if __name__ == '__main__':
     # Only try to write updates in DEV mode
     if IS_DEV:
@@ -0,0 +1,183 @@
+"""In-process latency benchmark for the API routes.
+
+Usage:
+    python benchmark.py [--requests N] [--rate-limit on|off] [ROUTE ...]
+    python benchmark.py --url http://127.0.0.1:5000 [--slow-clients N] [--duration S]
+    python benchmark.py --codec [--requests N]
+
+Requests go through the full Flask stack (before/after request hooks, error
+handling, JSON encoding) via the test client, so network cost is excluded
+and differences between runs come from the application itself. With
+``--rate-limit on`` each request uses a distinct client address, so the
+limiter is exercised on every call without ever rejecting one; compare with
+``--rate-limit off`` to measure its overhead.
+
+With ``--url`` the target is a running server instead: N slow clients hold
+connections open by trickling their request a byte at a time, while a probe
+measures how long a cheap request takes to be answered. This shows how many
+stalled connections a worker configuration absorbs before fast requests
+queue. (Slow uploads stand in for slow downloads because loopback socket
+buffers absorb even the largest response in one write.)
+
+``--codec`` times parsing and encoding of every data file with each
+available JSON backend (stdlib, orjson, msgspec, and msgspec typed decoding).
+"""
+import argparse
+import os
+import socket
+import statistics
+import threading
+import time
+from urllib.parse import urlparse
+
+import codec
+from app import app, limiter, Config, DATA_FILES
+
+DEFAULT_ROUTES = [
+    '/api/health',
+    '/api/faq',
+    '/api/firms',
+    '/api/roadmaps',
+    '/api/interview-questions',
+    '/api/interview-questions/1',
+    '/api/interview-questions/search?q=probability',
+    '/api/blog',
+    '/sitemap.xml',
+]
+
+
+def bench_route(client, route, requests, rate_limit):
+    timings = []
+    errors = 0
+    for i in range(requests):
+        environ = {'REMOTE_ADDR': f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"} if rate_limit else {}
+        start = time.perf_counter()
+        resp = client.get(route, environ_base=environ)
+        resp.get_data()
+        timings.append(time.perf_counter() - start)
+        if resp.status_code >= 400:
+            errors += 1
+    timings.sort()
+    return {
+        'mean_ms': statistics.fmean(timings) * 1000,
+        'p50_ms': timings[len(timings) // 2] * 1000,
+        'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        'rps': len(timings) / sum(timings),
+        'errors': errors,
+    }
+
+
+def _slow_client(host, port, path, stop):
+    sock = socket.create_connection((host, port))
+    try:
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n".encode())
+        # Trickle a header one byte at a time and never finish the request,
+        # holding whatever the server dedicated to this connection
+        while not stop.is_set():
+            sock.sendall(b"x")
+            time.sleep(0.2)
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+
+def bench_slow_clients(url, slow_path, probe_path, clients, duration):
+    """Latency of probe requests while `clients` slow downloads are in progress."""
+    target = urlparse(url)
+    host, port = target.hostname, target.port or 80
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=_slow_client, args=(host, port, slow_path, stop), daemon=True)
+        for _ in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(1)
+
+    timings = []
+    timeouts = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            with socket.create_connection((host, port), timeout=5) as sock:
+                sock.sendall(f"GET {probe_path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+                while sock.recv(65536):
+                    pass
+            timings.append(time.perf_counter() - start)
+        except socket.timeout:
+            timeouts += 1
+    stop.set()
+
+    timings.sort()
+    return {
+        'completed': len(timings),
+        'timeouts': timeouts,
+        'p50_ms': timings[len(timings) // 2] * 1000 if timings else None,
+        'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000 if timings else None,
+    }
+
+
+def _best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def bench_codecs(repeat):
+    """Best-of-N parse and encode time in ms for each data file and JSON backend."""
+    print(f"{'file':<26} {'KB':>6} {'backend':<16} {'parse ms':>9} {'encode ms':>10}")
+    for filename in DATA_FILES:
+        with open(os.path.join(Config.DATA_DIR, filename), 'rb') as f:
+            raw = f.read()
+        for name, (loads, dumps) in codec.BACKENDS.items():
+            data = loads(raw)
+            parse = _best_of(lambda: loads(raw), repeat)
+            encode = _best_of(lambda: dumps(data), repeat)
+            print(f"{filename:<26} {len(raw) / 1024:>6.0f} {name:<16} {parse:>9.2f} {encode:>10.2f}")
+        if filename in codec.STRUCTS:
+            typed = _best_of(lambda: codec.decode_typed(filename, raw), repeat)
+            print(f"{filename:<26} {len(raw) / 1024:>6.0f} {'msgspec typed':<16} {typed:>9.2f} {'-':>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('routes', nargs='*', default=DEFAULT_ROUTES)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--rate-limit', choices=['on', 'off'], default='on')
+    parser.add_argument('--url', help='benchmark a running server with slow clients instead')
+    parser.add_argument('--slow-clients', type=int, default=16)
+    parser.add_argument('--slow-path', default='/api/blog')
+    parser.add_argument('--probe-path', default='/api/health')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--codec', action='store_true', help='benchmark JSON backends on the data files')
+    args = parser.parse_args()
+
+    if args.codec:
+        bench_codecs(max(1, args.requests // 20))
+        return
+
+    if args.url:
+        r = bench_slow_clients(args.url, args.slow_path, args.probe_path, args.slow_clients, args.duration)
+        p50 = f"{r['p50_ms']:.1f}" if r['p50_ms'] is not None else '-'
+        p95 = f"{r['p95_ms']:.1f}" if r['p95_ms'] is not None else '-'
+        print(f"{args.slow_clients} slow clients on {args.slow_path}: {args.probe_path} "
+              f"completed={r['completed']} timeouts={r['timeouts']} p50={p50} ms p95={p95} ms")
+        return
+
+    limiter.enabled = args.rate_limit == 'on'
+    client = app.test_client()
+
+    print(f"{'route':<50} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>9} {'errors':>7}")
+    for route in args.routes:
+        client.get(route)  # warm the data caches
+        r = bench_route(client, route, args.requests, limiter.enabled)
+        print(f"{route:<50} {r['mean_ms']:>9.3f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['rps']:>9.0f} {r['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
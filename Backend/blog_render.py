@@ -0,0 +1,210 @@
+"""Server-side rendering of blog content blocks.
+
+Blog posts store ``content`` as a list of ``paragraph`` / ``heading`` / ``code``
+blocks whose text uses inline Markdown and ``$...$`` / ``$$...$$`` LaTeX.
+``render_post`` turns them into sanitized HTML once, along with the table of
+contents, word count and reading time the frontend used to derive per view.
+
+Math is not typeset here: spans are tokenized into ``math`` elements carrying
+the escaped TeX, and also returned as a list so the client can run KaTeX on them.
+"""
+import html
+import math
+import re
+from urllib.parse import urlparse
+
+WORDS_PER_MINUTE = 200
+DEFAULT_READING_TIME = 3
+
+SAFE_LINK_SCHEMES = ('http', 'https', 'mailto')
+
+# $$display$$ or $inline$, matched in one pass so math is numbered in document
+# order. Inline spans follow the Pandoc rule: no space after the opening or
+# before the closing $, and the closing $ is not followed by a digit, so
+# "$14,000 ... $4 billion" stays text. An opening $ followed by a digit is
+# also refused when the span holds a plain word (one not part of a TeX
+# command, script or group), so "$1.7 billion requires ...; $x$" stays
+# text while "$0.5 \cdot f^*$" is still math.
+_MATH_RE = re.compile(
+    r"\$\$(.+?)\$\$"
+    r"|(?<![\\$])\$(?![\s$])(?!\d[^$\n]*?(?<![\\A-Za-z{_^])[A-Za-z]{2})"
+    r"([^$\n]+?)(?<![\s\\])\$(?!\d)",
+    re.S
+)
+_CODE_SPAN_RE = re.compile(r"`([^`\n]+)`")
+# Link targets may contain balanced parentheses, as in Wikipedia URLs
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"(?<![\w*])[_*](?![\s_*])(.+?)(?<![\s_*])[_*](?![\w*])")
+_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+_LIST_ITEM_RE = re.compile(r"^\s*(?:([-*+])|(\d+)[.)])\s+(.*)$")
+
+
+def heading_id(text):
+    """Anchor id for a heading, matching the frontend's TableOfContents."""
+    return re.sub(r"[^\w]+", "-", text.lower())
+
+
+def _is_external(href):
+    return href.startswith('//') or urlparse(href).scheme.lower() in ('http', 'https')
+
+
+def _safe_href(href):
+    href = href.strip()
+    # Protocol-relative //host URLs pass too, and get rel like any external link
+    if href.startswith(('/', '#')):
+        return href
+    scheme = urlparse(href).scheme.lower()
+    if scheme in SAFE_LINK_SCHEMES:
+        return href
+    if not scheme:
+        # Bare slugs are internal blog links, as in the frontend's normalizeBlogLink
+        return '/blog/' + href
+    return None
+
+
+class _Renderer:
+    def __init__(self):
+        self.math = []
+
+    def _math_token(self, tex, display, tag='span'):
+        tex = tex.strip()
+        self.math.append({'index': len(self.math), 'tex': tex, 'display': display})
+        kind = 'math-display' if display else 'math-inline'
+        return f'<{tag} class="math {kind}" data-math="{len(self.math) - 1}">{html.escape(tex)}</{tag}>'
+
+    def inline(self, text):
+        """Render one line of inline Markdown to HTML."""
+        tokens = []
+
+        def stash(fragment):
+            tokens.append(fragment)
+            return f"\x00{len(tokens) - 1}\x00"
+
+        # Math and code spans are protected before any other markup is parsed
+        def math_span(m):
+            display = m.group(1) is not None
+            return stash(self._math_token(m.group(1) if display else m.group(2), display))
+
+        text = _MATH_RE.sub(math_span, text)
+        text = _CODE_SPAN_RE.sub(lambda m: stash(f"<code>{html.escape(m.group(1))}</code>"), text)
+
+        def link(m):
+            href = _safe_href(html.unescape(m.group(2)))
+            label = m.group(1)
+            if href is None:
+                return label
+            rel = ' rel="noopener noreferrer"' if _is_external(href) else ''
+            return f'<a href="{html.escape(href)}"{rel}>{label}</a>'
+
+        text = html.escape(text, quote=False)
+        text = _LINK_RE.sub(link, text)
+        text = _BOLD_RE.sub(r"<strong>\1</strong>", text)
+        text = _ITALIC_RE.sub(r"<em>\1</em>", text)
+        return _PLACEHOLDER_RE.sub(lambda m: tokens[int(m.group(1))], text)
+
+    def code(self, source, language=None):
+        cls = f' class="language-{html.escape(language)}"' if language else ''
+        return f"<pre><code{cls}>{html.escape(source)}</code></pre>"
+
+    def paragraph(self, text):
+        """Render a paragraph block, which may contain lists and fenced code."""
+        out = []
+        lines = []
+        list_tag = None
+        items = []
+
+        def flush_lines():
+            if lines:
+                out.append('<p>' + '<br>'.join(self.inline(l) for l in lines) + '</p>')
+                lines.clear()
+
+        def flush_list():
+            nonlocal list_tag
+            if items:
+                out.append(f"<{list_tag}>" + ''.join(f"<li>{i}</li>" for i in items) + f"</{list_tag}>")
+                items.clear()
+            list_tag = None
+
+        source = text.split('\n')
+        i = 0
+        while i < len(source):
+            line = source[i]
+            stripped = line.strip()
+
+            if stripped.startswith('```'):
+                flush_lines()
+                flush_list()
+                language = stripped[3:].strip() or None
+                body = []
+                i += 1
+                while i < len(source) and not source[i].strip().startswith('```'):
+                    body.append(source[i])
+                    i += 1
+                out.append(self.code('\n'.join(body), language))
+                i += 1
+                continue
+
+            match = _LIST_ITEM_RE.match(line)
+            if match:
+                flush_lines()
+                tag = 'ul' if match.group(1) else 'ol'
+                if list_tag and tag != list_tag:
+                    flush_list()
+                list_tag = tag
+                items.append(self.inline(match.group(3)))
+            elif stripped:
+                flush_list()
+                lines.append(stripped)
+            else:
+                flush_lines()
+                flush_list()
+            i += 1
+
+        flush_lines()
+        flush_list()
+        return ''.join(out)
+
+
+def count_words(content):
+    """Word count using the same whitespace split as the frontend."""
+    total = 0
+    for block in content or []:
+        if block.get('text'):
+            total += len(block['text'].split())
+    return total
+
+
+def render_post(post):
+    """Render a post's content blocks to HTML with TOC, word count and reading time."""
+    renderer = _Renderer()
+    parts = []
+    toc = []
+
+    for block in post.get('content') or []:
+        block_type = block.get('type')
+        text = block.get('text') or ''
+
+        if block_type == 'latex' or text.startswith('Latex:'):
+            parts.append(renderer._math_token(text.replace('Latex:', '', 1), True, tag='div'))
+        elif block_type == 'heading':
+            try:
+                level = min(max(int(block.get('level') or 2), 1), 6)
+            except (TypeError, ValueError):
+                level = 2
+            anchor = heading_id(text)
+            toc.append({'id': anchor, 'text': text, 'level': level})
+            parts.append(f'<h{level} id="{html.escape(anchor)}">{renderer.inline(text)}</h{level}>')
+        elif block_type == 'code':
+            parts.append(renderer.code(text, block.get('language') or 'python'))
+        else:
+            parts.append(renderer.paragraph(text))
+
+    word_count = count_words(post.get('content'))
+    return {
+        'html': '\n'.join(parts),
+        'toc': toc,
+        'math': renderer.math,
+        'word_count': word_count,
+        'reading_time': math.ceil(word_count / WORDS_PER_MINUTE) or DEFAULT_READING_TIME,
+    }
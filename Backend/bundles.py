@@ -0,0 +1,92 @@
+"""Content-addressed, sharded bundles of the list collections.
+
+Each collection is split into shards (by category, or by year for the blog),
+and every shard is serialized once and named after a hash of its bytes:
+
+    /api/bundles/interview-questions/mental-math.3f9c0a7e12b45d60.json
+
+A shard's URL changes whenever its content does, so shards can be cached
+forever (``Cache-Control: immutable``). Clients read the small manifest to
+learn the current shard URLs and only download shards whose hash changed.
+"""
+import hashlib
+import re
+
+import codec
+
+HASH_LENGTH = 16
+
+# Per-request fields merged into records that must not leak into shard contents
+VOLATILE_FIELDS = ('likes',)
+
+
+def shard_name(label):
+    """File-name-safe shard name for a category or year label."""
+    name = re.sub(r'[^a-z0-9]+', '-', str(label).lower()).strip('-')
+    return name or 'other'
+
+
+def by_category(record):
+    return record.get('category') or 'uncategorized'
+
+
+def by_year(record):
+    match = re.match(r'\d{4}', str(record.get('date') or ''))
+    return match.group(0) if match else 'undated'
+
+
+def build_collection(collection, records, shard_of):
+    """Split records into shards and serialize them.
+
+    Returns (manifest entry, {file name: body bytes}). Records are sorted by
+    id within each shard, so a shard's hash depends only on its content and
+    every worker names the same shard alike.
+    """
+    groups = {}
+    labels = {}
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        label = shard_of(record)
+        name = shard_name(label)
+        labels.setdefault(name, str(label))
+        groups.setdefault(name, []).append(
+            {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+        )
+
+    shards = {}
+    files = {}
+    for name in sorted(groups):
+        body = codec.dumps(sorted(groups[name], key=lambda r: str(r.get('id'))))
+        digest = hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+        file_name = f"{name}.{digest}.json"
+        files[file_name] = body
+        shards[name] = {
+            'label': labels[name],
+            'hash': digest,
+            'url': f"/api/bundles/{collection}/{file_name}",
+            'count': len(groups[name]),
+            'bytes': len(body),
+        }
+    return {'shards': shards}, files
+
+
+def build_bundles(specs):
+    """Build every collection's shards.
+
+    specs maps collection name -> (records, shard_of). Returns
+    (manifest, {(collection, file name): body bytes}); the manifest's
+    ``version`` is a hash over all shard hashes.
+    """
+    collections = {}
+    blobs = {}
+    for collection, (records, shard_of) in specs.items():
+        entry, files = build_collection(collection, records, shard_of)
+        collections[collection] = entry
+        for file_name, body in files.items():
+            blobs[(collection, file_name)] = body
+
+    version = hashlib.sha256(
+        '\n'.join(sorted(f"{c}/{f}" for c, f in blobs)).encode('utf-8')
+    ).hexdigest()[:HASH_LENGTH]
+    return {'version': version, 'collections': collections}, blobs
@@ -0,0 +1,105 @@
+"""Versioned journal of record-level changes to the data files.
+
+Whenever a data file is (re)loaded at a new modification time, its records
+are diffed by id against the previous load using per-record content hashes,
+and added / changed / removed entries are appended to a bounded journal.
+
+Versions are the files' st_mtime_ns, so every worker reading the same files
+agrees on them without any shared state. They are around 1.8e18, beyond the
+2**53 a JavaScript number holds exactly, so the API sends them as decimal
+strings.
+
+A worker can only vouch for changes after the first version of a file it
+loaded (and after the newest entry it has dropped from the journal). A client
+asking for changes since an older version of that file is told to resync that
+collection instead. The journal lives in process memory, so after a deploy or
+restart the floor is the mtime the new process first loaded, and a ``since``
+from before then always gets a full resync of every collection changed since.
+"""
+import hashlib
+import threading
+from collections import deque
+
+import codec
+
+
+def record_key(record):
+    """Stable identity of a record: its id, slug or (for FAQ entries) question."""
+    for field in ('id', 'slug', 'question'):
+        if record.get(field) is not None:
+            return str(record[field])
+    return None
+
+
+def record_hash(record):
+    return hashlib.blake2b(codec.dumps(record, sort_keys=True), digest_size=16).digest()
+
+
+class ChangeFeed:
+    def __init__(self, collections, max_entries=5000):
+        """collections maps data file name -> collection name reported to clients."""
+        self.collections = dict(collections)
+        self.max_entries = max_entries
+        self._journal = deque()
+        self._state = {}
+        self._floor = {}
+        self._lock = threading.Lock()
+
+    def observe(self, filename, version, data):
+        """Record a freshly parsed copy of filename at version (its st_mtime_ns)."""
+        if filename not in self.collections:
+            return
+        records = list(data.values()) if isinstance(data, dict) else data
+        keyed = {}
+        for record in records if isinstance(records, list) else []:
+            if isinstance(record, dict) and record_key(record) is not None:
+                keyed[record_key(record)] = record
+
+        with self._lock:
+            previous = self._state.get(filename)
+            if previous is not None and previous[0] >= version:
+                return
+            hashes = {key: record_hash(record) for key, record in keyed.items()}
+            self._state[filename] = (version, hashes)
+
+            if previous is None:
+                self._floor[filename] = version
+                return
+
+            collection = self.collections[filename]
+            old_hashes = previous[1]
+            for key, digest in hashes.items():
+                if key not in old_hashes:
+                    self._append(version, collection, 'added', key, keyed[key])
+                elif old_hashes[key] != digest:
+                    self._append(version, collection, 'changed', key, keyed[key])
+            for key in old_hashes.keys() - hashes.keys():
+                self._append(version, collection, 'removed', key, None)
+
+    def _append(self, version, collection, op, key, record):
+        entry = {'version': version, 'collection': collection, 'op': op, 'id': key}
+        if record is not None:
+            entry['record'] = record
+        self._journal.append(entry)
+        while len(self._journal) > self.max_entries:
+            dropped = self._journal.popleft()
+            filename = next(f for f, c in self.collections.items() if c == dropped['collection'])
+            self._floor[filename] = max(self._floor[filename], dropped['version'])
+
+    def current_version(self):
+        with self._lock:
+            return max((state[0] for state in self._state.values()), default=0)
+
+    def changes_since(self, since):
+        """Return (current version, changes after since, collections that need a full resync)."""
+        with self._lock:
+            resync = []
+            for filename, (version, _) in self._state.items():
+                if version > since and self._floor[filename] > since:
+                    resync.append(self.collections[filename])
+            changes = [
+                e for e in self._journal
+                if e['version'] > since and e['collection'] not in resync
+            ]
+            current = max((state[0] for state in self._state.values()), default=0)
+        return current, changes, sorted(resync)
@@ -0,0 +1,227 @@
+"""JSON codec shared by the data loader, the writers and Flask responses.
+
+Uses orjson or msgspec when installed (in that order, or as chosen by the
+JSON_CODEC environment variable) and falls back to the standard library.
+All backends take and return the same plain Python objects, and encode
+them to the same JSON, with one exception. msgspec encodes datetime, date
+and time values itself, as ISO 8601, and has no option to hand them to
+``default`` instead. So with msgspec, ``jsonify`` never applies Flask's
+HTTP-date format to them. orjson is told to pass dates and dataclasses
+through to ``default``; its own UUID output already matches Flask's. No
+route currently returns these types.
+
+With msgspec installed, ``decode_typed`` additionally decodes a data file
+straight into per-collection Structs, validating field types while it parses.
+"""
+import json
+import os
+import logging
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data):
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False, sort_keys=False, default=None):
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, default=default, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, default=default, ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def _orjson_dumps(obj, indent=False, sort_keys=False, default=None):
+    # Dates and dataclasses go through default, as with the json module
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=default, option=option)
+
+
+def _msgspec_dumps(obj, indent=False, sort_keys=False, default=None):
+    data = msgspec.json.encode(obj, enc_hook=default, order='sorted' if sort_keys else None)
+    return msgspec.json.format(data, indent=2) if indent else data
+
+
+# name -> (loads(bytes | str), dumps(obj, indent, sort_keys, default) -> bytes)
+BACKENDS = {'json': (_json_loads, _json_dumps)}
+if orjson is not None:
+    BACKENDS['orjson'] = (orjson.loads, _orjson_dumps)
+if msgspec is not None:
+    BACKENDS['msgspec'] = (msgspec.json.decode, _msgspec_dumps)
+
+
+def _select_backend():
+    requested = os.environ.get('JSON_CODEC')
+    if requested:
+        if requested in BACKENDS:
+            return requested
+        logger.warning(f"JSON_CODEC={requested} is not available, choosing automatically")
+    for name in ('orjson', 'msgspec', 'json'):
+        if name in BACKENDS:
+            return name
+
+
+BACKEND = _select_backend()
+_loads, _dumps = BACKENDS[BACKEND]
+
+
+def loads(data):
+    return _loads(data)
+
+
+def dumps(obj, indent=False, sort_keys=False, default=None):
+    """Serialize obj to UTF-8 JSON bytes."""
+    return _dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+
+def load_file(path):
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def dump_file(path, obj):
+    """Write obj as indented JSON, the layout the data files are kept in."""
+    with open(path, 'wb') as f:
+        f.write(_dumps(obj, indent=True))
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with the selected backend.
+
+    Keys keep the data files' order rather than being sorted. Under msgspec,
+    dates are encoded as ISO 8601 rather than HTTP dates (see the module docstring).
+    """
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        return dumps(
+            obj,
+            indent=bool(kwargs.get('indent')),
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            default=kwargs.get('default', self.default)
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = dumps(obj, indent=indent, sort_keys=self.sort_keys, default=self.default)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+# --- Typed decoding (msgspec only) ---
+
+STRUCTS = {}
+
+if msgspec is not None:
+    from typing import Any, Dict, List, Optional, Union
+
+    def _list():
+        return msgspec.field(default_factory=list)
+
+    class InterviewQuestion(msgspec.Struct):
+        id: Union[int, str]
+        question: str
+        difficulty: str = ''
+        category: str = ''
+        tags: List[str] = _list()
+        firm: str = ''
+        approach: str = ''
+        key_concepts: List[str] = _list()
+        answer: Union[str, List[str]] = ''
+        follow_up: str = ''
+        reference: str = ''
+        slug: str = ''
+
+    class ContentBlock(msgspec.Struct):
+        type: str
+        text: str = ''
+        level: Optional[int] = None
+        language: Optional[str] = None
+
+    class BlogPost(msgspec.Struct):
+        id: str
+        title: str
+        slug: str = ''
+        excerpt: str = ''
+        date: str = ''
+        author: str = ''
+        category: str = ''
+        content: List[ContentBlock] = _list()
+
+    class Firm(msgspec.Struct):
+        id: str
+        name: str
+        category: str = ''
+        location: str = ''
+        description: str = ''
+        requirements: List[str] = _list()
+        qualities: List[str] = _list()
+        roles: List[str] = _list()
+        slug: str = ''
+
+    class Resource(msgspec.Struct):
+        id: str
+        title: str
+        description: str = ''
+        category: str = ''
+        type: str = ''
+        link: str = ''
+        filename: str = ''
+        slug: str = ''
+        Content: List[Any] = _list()
+
+    class FaqEntry(msgspec.Struct):
+        question: str
+        answer: str
+        category: str = ''
+
+    class Roadmap(msgspec.Struct):
+        id: str
+        title: str
+        description: str = ''
+        schools: List[Dict[str, Any]] = _list()
+        skills: List[Dict[str, Any]] = _list()
+        resources: List[Dict[str, Any]] = _list()
+        roadmap_steps: List[Dict[str, Any]] = _list()
+        roadmap: List[Dict[str, Any]] = _list()
+        roles_comparison: List[Dict[str, Any]] = _list()
+
+    STRUCTS = {
+        'interview_questions.json': List[InterviewQuestion],
+        'blog.json': List[BlogPost],
+        'firms.json': List[Firm],
+        'early_career.json': List[Firm],
+        'resources.json': List[Resource],
+        'faq.json': List[FaqEntry],
+        'roadmaps.json': Dict[str, Roadmap],
+    }
+
+
+def decode_typed(filename, data):
+    """Decode a data file's bytes into its typed Structs, raising on schema violations.
+
+    Requires msgspec; raises KeyError for files without a registered schema.
+    """
+    if msgspec is None:
+        raise RuntimeError("Typed decoding requires msgspec")
+    return msgspec.json.decode(data, type=STRUCTS[os.path.basename(filename)])
@@ -0,0 +1,268 @@
+"""Build-time compile stage for the data files.
+
+Usage:
+    python compile_data.py [--check]
+
+Every collection is validated against its schema: codec.STRUCTS when msgspec
+is installed, otherwise the required fields below. Ids and slugs must be
+unique, and every date must parse. Dates are normalized to ISO 8601. Fields
+that request handlers would otherwise recompute are derived once per record:
+lowercased search text and filters, the canonical site path, the sitemap
+lastmod, an is_pdf flag for resources and a content hash.
+
+The result is written to data/compiled/<name>.<size>-<mtime_ns>.json, named
+after the size and mtime of the source file it was built from. The server
+looks only for the artifact named after the source's current stat, so a
+stale artifact costs one failed open rather than a parse, and uses it as-is;
+without one it derives the same fields at runtime, so editing data during
+development needs no rebuild. Any
+validation error exits non-zero, which fails the Docker build. ``--check``
+validates without writing.
+"""
+import os
+import re
+import sys
+from datetime import datetime
+
+import codec
+import jsonl_store
+from slugs import make_slug
+from change_feed import record_hash
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+COMPILED_DIR_NAME = 'compiled'
+
+SOURCES = [
+    'blog.json', 'roadmaps.json', 'firms.json', 'interview_questions.json',
+    'resources.json', 'early_career.json', 'faq.json'
+]
+
+# Used to validate when msgspec (and so codec.STRUCTS) is unavailable
+REQUIRED_FIELDS = {
+    'interview_questions.json': ('id', 'question'),
+    'blog.json': ('id', 'title'),
+    'firms.json': ('id', 'name'),
+    'early_career.json': ('id', 'name'),
+    'resources.json': ('id', 'title'),
+    'faq.json': ('question', 'answer'),
+    'roadmaps.json': ('id', 'title'),
+}
+
+DATE_FIELDS = ('date', 'updated_at', 'created_at', 'published_date')
+DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']
+
+# Date fields, in order of preference, that give a page's sitemap lastmod;
+# pages of the other collections use the sitemap's generation date
+LASTMOD_FIELDS = {
+    'blog.json': ('date',),
+    'roadmaps.json': ('updated_at', 'date'),
+    'firms.json': ('updated_at',),
+    'resources.json': DATE_FIELDS,
+}
+
+
+class CompileError(ValueError):
+    pass
+
+
+def normalize_date(value):
+    """ISO 8601 form of a date string: YYYY-MM-DD, or a full timestamp if it has a time."""
+    if not isinstance(value, str):
+        raise CompileError(f"not a date string: {value!r}")
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        for fmt in DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(value.split('T')[0], fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise CompileError(f"unparseable date: {value!r}")
+    if parsed.time() == datetime.min.time() and parsed.tzinfo is None:
+        return parsed.date().isoformat()
+    return parsed.isoformat()
+
+
+def canonical_path(filename, record):
+    """Site path of a record's page, as listed in the sitemap; None if it has none."""
+    if filename == 'interview_questions.json':
+        return f"/interview-questions/{record['slug']}" if record.get('slug') else None
+    if filename == 'resources.json':
+        slug = record.get('slug')
+        if not slug:
+            slug = make_slug(record.get('title', '')[:80])
+            if not slug and record.get('id'):
+                slug = f"resource-{record.get('id')}"
+        return f"/resources/{slug}" if slug else None
+    if filename == 'faq.json':
+        return f"/faq/{record['slug']}" if record.get('id') and record.get('slug') else None
+
+    prefix = {
+        'blog.json': '/blog', 'roadmaps.json': '/roadmaps',
+        'firms.json': '/firms', 'early_career.json': '/early-career',
+    }.get(filename)
+    return f"{prefix}/{record['id']}" if prefix and record.get('id') else None
+
+
+def is_pdf(record):
+    if 'pdf' in str(record.get('type', '')).lower() or str(record.get('filename', '')).lower().endswith('.pdf'):
+        return True
+    return 'link' in record and 'pdf' in str(record.get('link', '')).lower()
+
+
+def derive(filename, record):
+    """Precomputed fields for one record. Unparseable dates give no lastmod rather than failing."""
+    meta = {'path': canonical_path(filename, record), 'hash': record_hash(record).hex()}
+
+    lastmod = None
+    for field in LASTMOD_FIELDS.get(filename, ()):
+        if record.get(field):
+            try:
+                lastmod = normalize_date(record[field])[:10]
+            except CompileError:
+                pass
+            break
+    meta['lastmod'] = lastmod
+
+    if filename == 'interview_questions.json':
+        search_fields = [
+            record.get('question', ''),
+            record.get('approach', ''),
+            record.get('answer', ''),
+            ' '.join(record.get('tags', [])),
+            ' '.join(record.get('key_concepts', [])),
+            record.get('firm', '')
+        ]
+        meta.update(
+            search_text=' '.join(str(field) for field in search_fields).lower(),
+            question=str(record.get('question', '')).lower(),
+            answer=str(record.get('answer', '')).lower(),
+            tags=' '.join(record.get('tags', [])).lower(),
+            category=str(record.get('category') or '').lower(),
+            difficulty=str(record.get('difficulty') or '').lower(),
+        )
+    elif filename == 'resources.json':
+        meta['is_pdf'] = is_pdf(record)
+    return meta
+
+
+def records_of(data):
+    return list(data.values()) if isinstance(data, dict) else data
+
+
+def validate(filename, data):
+    """Check data against its schema; returns a list of error messages."""
+    errors = []
+    if filename in codec.STRUCTS:
+        try:
+            codec.decode_typed(filename, codec.dumps(data))
+        except ValueError as e:
+            errors.append(f"schema: {e}")
+    else:
+        for position, record in enumerate(records_of(data)):
+            if not isinstance(record, dict):
+                errors.append(f"record {position}: not an object")
+                continue
+            missing = [f for f in REQUIRED_FIELDS.get(filename, ()) if record.get(f) in (None, '')]
+            if missing:
+                errors.append(f"record {position}: missing {', '.join(missing)}")
+
+    for key in ('id', 'slug'):
+        seen = set()
+        for record in records_of(data):
+            value = record.get(key) if isinstance(record, dict) else None
+            if value in (None, ''):
+                continue
+            if str(value) in seen:
+                errors.append(f"duplicate {key} {value!r}")
+            seen.add(str(value))
+    return errors
+
+
+def compile_collection(filename, data):
+    """Validate data, normalize its dates in place and derive per-record fields."""
+    errors = validate(filename, data)
+    for position, record in enumerate(records_of(data)):
+        if not isinstance(record, dict):
+            continue
+        for field in DATE_FIELDS:
+            if record.get(field):
+                try:
+                    record[field] = normalize_date(record[field])
+                except CompileError as e:
+                    errors.append(f"record {position} {field}: {e}")
+    if errors:
+        raise CompileError('\n'.join(f"{filename}: {e}" for e in errors))
+    return [derive(filename, record) for record in records_of(data)]
+
+
+def source_path(data_dir, filename):
+    """The file a collection is read from: its .jsonl form when one exists."""
+    return jsonl_store.storage_path(os.path.join(data_dir, filename))
+
+
+def compiled_path(data_dir, filename, stat):
+    """Path of the artifact built from filename's source file as it was at stat."""
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(data_dir, COMPILED_DIR_NAME, f"{stem}.{stat.st_size}-{stat.st_mtime_ns}.json")
+
+
+def _remove_stale(data_dir, filename, keep):
+    """Delete filename's artifacts other than keep."""
+    directory = os.path.join(data_dir, COMPILED_DIR_NAME)
+    pattern = re.compile(re.escape(os.path.splitext(filename)[0]) + r"\.\d+-\d+\.json")
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if pattern.fullmatch(name) and path != keep:
+            os.remove(path)
+
+
+def load_compiled(data_dir, filename, stat):
+    """The compiled artifact for filename if one was built from the source file with this stat, else None."""
+    try:
+        return codec.load_file(compiled_path(data_dir, filename, stat))
+    except (OSError, ValueError):
+        return None
+
+
+def compile_all(data_dir=DATA_DIR, write=True):
+    """Compile every source present in data_dir; returns {filename: record count}."""
+    counts = {}
+    errors = []
+    for filename in SOURCES:
+        path = source_path(data_dir, filename)
+        if not os.path.exists(path):
+            continue
+        stat = os.stat(path)
+        data = jsonl_store.read_records(path)
+        try:
+            derived = compile_collection(filename, data)
+        except CompileError as e:
+            errors.append(str(e))
+            continue
+        counts[filename] = len(derived)
+
+        if write:
+            target = compiled_path(data_dir, filename, stat)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target + '.tmp', 'wb') as f:
+                f.write(codec.dumps({'data': data, 'derived': derived}))
+            os.replace(target + '.tmp', target)
+            _remove_stale(data_dir, filename, target)
+
+    if errors:
+        raise CompileError('\n'.join(errors))
+    return counts
+
+
+if __name__ == '__main__':
+    check_only = '--check' in sys.argv[1:]
+    try:
+        result = compile_all(write=not check_only)
+    except CompileError as e:
+        print(f"Data compile failed:\n{e}", file=sys.stderr)
+        sys.exit(1)
+    for name, count in result.items():
+        print(f"{'Checked' if check_only else 'Compiled'} {name}: {count} records")
@@ -1,6 +1,11 @@
 # update_slugs_simple.py
-import json
+import os
 import re
+import sys
+
+# Shared storage helpers live in the Backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import jsonl_store
 
 def make_slug(text, max_words=10):
     """Generate URL-friendly slug from text."""
@@ -41,12 +46,13 @@ def generate_question_slug(question):
     return slug
 
 def update_all_slugs():
-    # File is in the same directory
-    data_file = 'interview_questions.json'
+    # File is in the same directory; its .jsonl form is the one the server reads when present
+    data_file = jsonl_store.storage_path(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'interview_questions.json')
+    )
     
     print(f"Loading {data_file}...")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        questions = json.load(f)
+    questions = jsonl_store.read_records(data_file)
     
     print(f"Loaded {len(questions)} questions")
     
@@ -74,8 +80,7 @@ def update_all_slugs():
     
     # Save back
     print(f"\nSaving {updated_count} updated questions...")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, indent=2)
+    jsonl_store.write_records(data_file, questions)
     
     print(f"\n✅ Updated {updated_count} questions with new slugs")
     print(f"📊 Total questions: {len(questions)}")
@@ -0,0 +1,100 @@
+"""Memory-bounded cache of parsed data files.
+
+Each entry is charged its estimated in-memory size (a walk of the parsed
+object graph with sys.getsizeof). When the total exceeds the budget, least
+recently used entries are evicted, except pinned files, which always stay
+resident. Per-file size, hit, load and eviction counts are kept so instance
+sizes can be chosen from real numbers.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(obj):
+    """Approximate bytes held by a parsed JSON value, counting shared objects once."""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return total
+
+
+class DataCache:
+    def __init__(self, max_bytes, pinned=(), on_evict=None):
+        self.max_bytes = max_bytes
+        self.pinned = set(pinned)
+        self.on_evict = on_evict
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _file_stats(self, filename):
+        return self._stats.setdefault(filename, {'hits': 0, 'misses': 0, 'loads': 0, 'evictions': 0, 'bytes': 0})
+
+    def __contains__(self, filename):
+        return filename in self._entries
+
+    def get(self, filename, mtime, default=None):
+        """Cached data for filename if it was loaded from this mtime, else default."""
+        with self._lock:
+            stats = self._file_stats(filename)
+            entry = self._entries.get(filename)
+            if entry is None or entry[0] != mtime:
+                stats['misses'] += 1
+                return default
+            self._entries.move_to_end(filename)
+            stats['hits'] += 1
+            return entry[1]
+
+    def put(self, filename, mtime, data):
+        size = estimate_size(data)
+        evicted = []
+        with self._lock:
+            old = self._entries.pop(filename, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[filename] = (mtime, data, size)
+            self._bytes += size
+
+            stats = self._file_stats(filename)
+            stats['loads'] += 1
+            stats['bytes'] = size
+
+            for name in list(self._entries):
+                if self._bytes <= self.max_bytes:
+                    break
+                if name in self.pinned or name == filename:
+                    continue
+                _, _, evicted_size = self._entries.pop(name)
+                self._bytes -= evicted_size
+                self._stats[name]['evictions'] += 1
+                evicted.append(name)
+
+        if self.on_evict:
+            for name in evicted:
+                self.on_evict(name)
+
+    def stats(self):
+        with self._lock:
+            files = {}
+            for name, stats in self._stats.items():
+                lookups = stats['hits'] + stats['misses']
+                files[name] = dict(
+                    stats,
+                    resident=name in self._entries,
+                    pinned=name in self.pinned,
+                    hit_rate=round(stats['hits'] / lookups, 4) if lookups else None
+                )
+            return {'bytes': self._bytes, 'max_bytes': self.max_bytes, 'files': files}
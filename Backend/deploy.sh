@@ -16,4 +16,5 @@ gcloud run deploy $IMAGE_NAME \
   --platform managed \
   --region $REGION \
   --allow-unauthenticated \
-  --port 5000
\ No newline at end of file
+  --port 5000 \
+  --set-env-vars TRUSTED_PROXIES=1
\ No newline at end of file
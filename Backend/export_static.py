@@ -0,0 +1,184 @@
+"""Export every read-only API response as pre-compressed static files.
+
+Usage:
+    python export_static.py [OUTPUT_DIR]
+
+Each route is rendered through the Flask app itself, so the files are
+byte-for-byte what the API would return. Every response is written as
+``<path>.json`` (or its own name for robots.txt / sitemap.xml) plus ``.gz``
+and, when the ``brotli`` package is installed, ``.br`` siblings. A
+``manifest.json`` records the ETag, content type and sizes of every file.
+
+The blog list and posts are not exported: they carry live like counts,
+which a static copy would freeze. Together with like/unlike, search,
+random, batch, stats and the change feed they are always answered by Flask.
+
+``try_files`` ignores the query string, so query-string variants are not
+exported either and a request for one would be answered with the plain
+file. Clients of the export must use the path-based routes instead:
+``/api/interview-questions/page/<n>`` rather than ``?page=N`` and
+``/api/roadmaps/summary`` rather than ``?view=summary``. The blog's
+``?format=html`` needs no path form, as blog URLs always reach Flask.
+
+Example nginx location serving the export with a backend fallback:
+
+    location /api/ {
+        root /srv/qfw-export;
+        gzip_static on;
+        brotli_static on;  # requires ngx_brotli
+        default_type application/json;
+        try_files $uri.json $uri @backend;
+    }
+
+Files under api/bundles/ other than manifest.json are content-addressed
+shards; the ``cache_control`` recorded for them in the manifest is
+``immutable`` and should be sent as-is.
+"""
+import gzip
+import hashlib
+import json
+import os
+import sys
+import logging
+from urllib.parse import quote
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from app import app, Config, limiter, load_json_safe, get_derived, get_bundles, _build_roadmap_sections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static_export')
+
+# (list route, data file, detail route by id, detail route by slug)
+COLLECTION_ROUTES = [
+    ('/api/early-career', 'early_career.json', '/api/early-career/{}', '/api/early-career/slug/{}'),
+    ('/api/roadmaps', 'roadmaps.json', '/api/roadmaps/{}', None),
+    ('/api/firms', 'firms.json', '/api/firms/{}', '/api/firms/slug/{}'),
+    ('/api/faq', 'faq.json', None, None),
+    ('/api/resources', 'resources.json', '/api/resources/{}', '/api/resources/slug/{}'),
+    ('/api/interview-questions', 'interview_questions.json', '/api/interview-questions/{}', '/api/interview-questions/{}'),
+]
+
+STATIC_ROUTES = ['/robots.txt', '/sitemap.xml']
+
+
+def _safe_segment(value):
+    """Return a path segment for an id/slug, or None if it cannot be a file name."""
+    value = str(value)
+    if not value or value.startswith('.') or '/' in value:
+        return None
+    return quote(value, safe='')
+
+
+def iter_routes():
+    """Yield (url, relative file path) for every exportable route."""
+    for route in STATIC_ROUTES:
+        yield route, route.lstrip('/')
+
+    for list_route, filename, id_route, slug_route in COLLECTION_ROUTES:
+        yield list_route, list_route.lstrip('/') + '.json'
+
+        data = load_json_safe(filename)
+        records = list(data.values()) if isinstance(data, dict) else data
+        seen = set()
+        for record in records:
+            for route, key in ((id_route, 'id'), (slug_route, 'slug')):
+                if not route or not record.get(key):
+                    continue
+                segment = _safe_segment(record[key])
+                if segment is None:
+                    logger.warning(f"Skipping unexportable {key} {record[key]!r} in {filename}")
+                    continue
+                url = route.format(segment)
+                if url in seen:
+                    continue
+                seen.add(url)
+                yield url, url.lstrip('/') + '.json'
+
+    # Roadmap summaries and the sections fetched lazily by the roadmap pages
+    yield '/api/roadmaps/summary', 'api/roadmaps/summary.json'
+    summaries, _ = get_derived('roadmap_sections', ['roadmaps.json'], _build_roadmap_sections)
+    for summary in summaries:
+        segment = _safe_segment(summary['id'])
+        if segment is None:
+            continue
+        for section in summary['sections']:
+            url = f"/api/roadmaps/{segment}/sections/{section['index']}"
+            yield url, url.lstrip('/') + '.json'
+
+    # Paginated question views, matching the pages listed in the sitemap
+    questions = load_json_safe('interview_questions.json')
+    per_page = Config.QUESTIONS_PER_PAGE
+    total_pages = (len(questions) + per_page - 1) // per_page
+    for page in range(1, total_pages + 1):
+        url = f"/api/interview-questions/page/{page}"
+        yield url, url.lstrip('/') + '.json'
+
+    # Content-addressed shards already end in .json and are served under their own name
+    manifest, _ = get_bundles()
+    yield '/api/bundles/manifest', 'api/bundles/manifest.json'
+    for entry in manifest['collections'].values():
+        for shard in entry['shards'].values():
+            yield shard['url'], shard['url'].lstrip('/')
+
+
+def _write(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+
+
+def export_static(output_dir=DEFAULT_OUTPUT_DIR):
+    """Render every route into output_dir and return the manifest."""
+    manifest = {}
+    client = app.test_client()
+    # Every route is requested from one address; don't let the limiter throttle the export
+    limiter.enabled = False
+
+    for url, rel_path in iter_routes():
+        resp = client.get(url)
+        if resp.status_code != 200:
+            logger.warning(f"Skipping {url}: HTTP {resp.status_code}")
+            continue
+
+        body = resp.get_data()
+        target = os.path.join(output_dir, rel_path)
+        _write(target, body)
+
+        gz_body = gzip.compress(body, compresslevel=9, mtime=0)
+        _write(target + '.gz', gz_body)
+
+        entry = {
+            'file': rel_path,
+            'etag': '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+            'content_type': resp.mimetype,
+            'cache_control': resp.headers.get('Cache-Control'),
+            'bytes': len(body),
+            'gzip_bytes': len(gz_body),
+        }
+
+        if brotli is not None:
+            br_body = brotli.compress(body, quality=11)
+            _write(target + '.br', br_body)
+            entry['br_bytes'] = len(br_body)
+
+        manifest[url] = entry
+
+    _write(
+        os.path.join(output_dir, 'manifest.json'),
+        json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+    )
+    return manifest
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+    result = export_static(out_dir)
+    total = sum(e['bytes'] for e in result.values())
+    print(f"Exported {len(result)} responses ({total / 1024:.0f} KB uncompressed) to {out_dir}")
+    if brotli is None:
+        print("brotli not installed: skipped .br files")
@@ -0,0 +1,292 @@
+"""JSON Lines storage for the large collections, with a sidecar offset index.
+
+A collection stored as ``<name>.jsonl`` holds one compact JSON record per
+line. ``<name>.jsonl.idx`` maps each record's id and slug to the byte offset
+and length of its line, so a detail lookup memory-maps the file and decodes
+just that slice instead of parsing the whole collection. New records are
+appended as a line plus an index entry, without rewriting the file.
+
+The index stores the size and mtime of the .jsonl file it describes. If the
+file was changed some other way (say, edited by hand), the index is rebuilt
+from a scan on the next open.
+
+Convert an existing array file (the .json file is left in place; the server
+reads the .jsonl form whenever it exists), add records, or go back:
+
+    python jsonl_store.py convert data/interview_questions.json
+    python jsonl_store.py append data/interview_questions.jsonl new_questions.json
+    python jsonl_store.py export data/interview_questions.jsonl  # back to an array
+
+``append`` takes a JSON file holding one record or a list of them.
+
+Anything that rewrites a data file should go through ``storage_path``,
+``read_records`` and ``write_records``, so that it changes the file the server
+actually reads.
+"""
+import mmap
+import os
+import sys
+import threading
+
+import codec
+
+_append_lock = threading.Lock()
+
+
+def jsonl_path(json_path):
+    """The .jsonl path for a .json data file path."""
+    return os.path.splitext(json_path)[0] + '.jsonl'
+
+
+def index_path(path):
+    return path + '.idx'
+
+
+def storage_path(json_path):
+    """The file a .json data file's records are kept in: its .jsonl form when one exists."""
+    path = jsonl_path(json_path)
+    return path if os.path.exists(path) else json_path
+
+
+def read_records(path):
+    """All records of a .jsonl file, or the contents of a .json file."""
+    if not path.endswith('.jsonl'):
+        return codec.load_file(path)
+    store = JsonlStore(path)
+    try:
+        return store.load_all()
+    finally:
+        store.close()
+
+
+def write_records(path, records):
+    """Replace a .jsonl file (and its index) or a .json file with records."""
+    if path.endswith('.jsonl'):
+        write_jsonl(path, records)
+        return
+    tmp_path = path + '.tmp'
+    codec.dump_file(tmp_path, records)
+    os.replace(tmp_path, path)
+
+
+def _keys(record):
+    """Index keys of a record: ('id', value) and ('slug', value) where present."""
+    keys = []
+    if record.get('id') is not None:
+        keys.append(('id', str(record['id'])))
+    if record.get('slug'):
+        keys.append(('slug', str(record['slug'])))
+    return keys
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _write_index(path, index):
+    index['size'], index['mtime_ns'] = _stamp(path)
+    tmp_path = index_path(path) + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(codec.dumps(index))
+    os.replace(tmp_path, index_path(path))
+
+
+def _scan(path):
+    """Build an index by reading every line of a .jsonl file."""
+    index = {'count': 0, 'id': {}, 'slug': {}}
+    offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            length = len(line.rstrip(b'\r\n'))
+            if length:
+                record = codec.loads(line)
+                for field, value in _keys(record):
+                    index[field].setdefault(value, [offset, length])
+                index['count'] += 1
+            offset += len(line)
+    return index
+
+
+def write_jsonl(path, records):
+    """Write records as a .jsonl file plus its index, replacing both atomically."""
+    index = {'count': 0, 'id': {}, 'slug': {}}
+    offset = 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for record in records:
+            line = codec.dumps(record)
+            f.write(line + b'\n')
+            for field, value in _keys(record):
+                index[field].setdefault(value, [offset, len(line)])
+            index['count'] += 1
+            offset += len(line) + 1
+    os.replace(tmp_path, path)
+    _write_index(path, index)
+
+
+def append_record(path, record):
+    """Append one record and its index entry; ids and slugs must be new."""
+    with _append_lock:
+        store = JsonlStore(path)
+        for field, value in _keys(record):
+            if value in store.index[field]:
+                raise ValueError(f"Duplicate {field} {value!r} in {os.path.basename(path)}")
+        store.close()
+
+        line = codec.dumps(record)
+        with open(path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            if offset and not _ends_with_newline(path, offset):
+                f.write(b'\n')
+                offset += 1
+            f.write(line + b'\n')
+
+        index = store.index
+        for field, value in _keys(record):
+            index[field][value] = [offset, len(line)]
+        index['count'] += 1
+        _write_index(path, index)
+
+
+def _ends_with_newline(path, size):
+    with open(path, 'rb') as f:
+        f.seek(size - 1)
+        return f.read(1) == b'\n'
+
+
+class JsonlStore:
+    """Read access to one .jsonl file through its offset index and a read-only mmap."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size, self.mtime_ns = _stamp(path)
+        self.index = self._load_index()
+        self._file = open(path, 'rb')
+        # mmap refuses empty files
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+    def _load_index(self):
+        try:
+            with open(index_path(self.path), 'rb') as f:
+                index = codec.loads(f.read())
+            if index.get('size') == self.size and index.get('mtime_ns') == self.mtime_ns:
+                return index
+        except (OSError, ValueError):
+            pass
+
+        index = _scan(self.path)
+        try:
+            _write_index(self.path, index)
+        except OSError:
+            # Read-only deployments just keep the rebuilt index in memory
+            pass
+        return index
+
+    def __len__(self):
+        return self.index['count']
+
+    def get(self, identifier, prefer='id'):
+        """Decode the record with this id or slug, trying the preferred key first; None if absent."""
+        identifier = str(identifier)
+        fields = ('slug', 'id') if prefer == 'slug' else ('id', 'slug')
+        for field in fields:
+            entry = self.index[field].get(identifier)
+            if entry is not None:
+                offset, length = entry
+                return codec.loads(self._map[offset:offset + length])
+        return None
+
+    def __iter__(self):
+        """Decode records one line at a time, in file order."""
+        start = 0
+        while start < self.size:
+            end = self._map.find(b'\n', start)
+            if end == -1:
+                end = self.size
+            if end > start:
+                yield codec.loads(self._map[start:end])
+            start = end + 1
+
+    def load_all(self):
+        """Every record, in file order.
+
+        Raw newlines only ever separate records (JSON escapes them inside
+        strings), so the file is decoded in one call as an array; blank lines
+        make that fail, in which case it is decoded line by line.
+        """
+        body = bytes(self._map[:self.size]).strip(b'\n')
+        if not body:
+            return []
+        try:
+            return codec.loads(b'[' + body.replace(b'\n', b',') + b']')
+        except ValueError:
+            return list(self)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+def convert(json_file):
+    """Write <name>.jsonl and its index next to an array-of-records .json file."""
+    records = codec.load_file(json_file)
+    if not isinstance(records, list):
+        raise ValueError(f"{json_file} is not a list of records")
+    target = jsonl_path(json_file)
+    write_jsonl(target, records)
+    return target, len(records)
+
+
+def export(jsonl_file):
+    """Write the records of a .jsonl file back out as an indented .json array."""
+    records = read_records(jsonl_file)
+    target = os.path.splitext(jsonl_file)[0] + '.json'
+    codec.dump_file(target, records)
+    return target, len(records)
+
+
+def append(jsonl_file, records_file):
+    """Append the record (or list of records) in a .json file to a .jsonl file.
+
+    Every record is checked before any is written, so a duplicate id or slug
+    leaves the file unchanged.
+    """
+    records = codec.load_file(records_file)
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError(f"{records_file} must hold a record or a list of records")
+
+    store = JsonlStore(jsonl_file)
+    try:
+        seen = {field: set(store.index[field]) for field in ('id', 'slug')}
+    finally:
+        store.close()
+    for record in records:
+        for field, value in _keys(record):
+            if value in seen[field]:
+                raise ValueError(f"Duplicate {field} {value!r} in {os.path.basename(jsonl_file)}")
+            seen[field].add(value)
+
+    for record in records:
+        append_record(jsonl_file, record)
+    return jsonl_file, len(records)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3 or sys.argv[1] not in ('convert', 'export', 'append'):
+        print(__doc__)
+        sys.exit(1)
+    if sys.argv[1] == 'append':
+        if len(sys.argv) != 4:
+            print(__doc__)
+            sys.exit(1)
+        target, count = append(sys.argv[2], sys.argv[3])
+        print(f"Appended {count} records to {target}")
+        sys.exit(0)
+    action = convert if sys.argv[1] == 'convert' else export
+    for path in sys.argv[2:]:
+        target, count = action(path)
+        print(f"Wrote {count} records to {target}")
@@ -0,0 +1,236 @@
+"""Lightweight per-client rate limiting and load shedding.
+
+Every request is assigned a route class ('expensive' or 'default'). Each
+(client IP, route class) pair has a token bucket; an empty bucket returns
+429 with Retry-After. Expensive routes additionally have a per-worker
+concurrency cap: when the number of in-flight expensive requests reaches the
+cap, new ones are shed with 503 and Retry-After instead of queueing behind
+the busy workers.
+
+Buckets live in process memory by default. With RATE_LIMIT_BACKEND=sqlite
+they are kept in a local SQLite file so all gunicorn workers on an instance
+share the same counters.
+
+Clients are identified by their socket address. X-Forwarded-For is only
+read when trusted_proxies says how many proxies in front of the app append
+to it; otherwise any client could pick a fresh address per request.
+
+A bucket that has refilled to capacity holds no more state than a missing
+one, so both backends periodically drop full buckets. Storage then grows
+with the number of recently active clients, not with every address ever
+seen.
+"""
+import os
+import math
+import sqlite3
+import threading
+import time
+import logging
+
+from flask import request, jsonify, g
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps for buckets that have refilled to capacity
+SWEEP_INTERVAL = 60
+
+
+def _full_at(tokens, capacity, refill_rate, now):
+    """Time at which a bucket holding tokens at now is back to capacity."""
+    return now + (capacity - tokens) / refill_rate
+
+
+class MemoryBackend:
+    """Token buckets held in this process only."""
+
+    def __init__(self):
+        # key -> (tokens, updated, full_at)
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + SWEEP_INTERVAL
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _sweep(self, now):
+        full = [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]
+        for key in full:
+            del self._buckets[key]
+        self._next_sweep = now + SWEEP_INTERVAL
+
+    def take(self, key, capacity, refill_rate, now=None):
+        """Take one token. Returns (allowed, seconds until a token is available)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, _full_at(tokens, capacity, refill_rate, now))
+            return (True, 0) if allowed else (False, (1 - tokens) / refill_rate)
+
+
+class SqliteBackend:
+    """Token buckets in a local SQLite file, shared by every worker process."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._next_sweep = time.time() + SWEEP_INTERVAL
+        conn = self._connect()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(buckets)")}
+        if columns and 'full_at' not in columns:
+            # Counters are disposable: replace a table from before full_at was tracked
+            conn.execute("DROP TABLE buckets")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, full_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS buckets_full_at ON buckets (full_at)")
+        conn.commit()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def take(self, key, capacity, refill_rate, now=None):
+        # Wall clock, since monotonic clocks are not comparable across processes
+        now = time.time() if now is None else now
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = min(capacity, tokens + max(0.0, now - updated) * refill_rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, _full_at(tokens, capacity, refill_rate, now))
+            )
+            if now >= self._next_sweep:
+                # Each worker sweeps on its own schedule; deleting full buckets is idempotent
+                self._next_sweep = now + SWEEP_INTERVAL
+                conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return (True, 0) if allowed else (False, (1 - tokens) / refill_rate)
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+
+
+class RateLimiter:
+    """Token-bucket limiter and concurrency cap wired into a Flask app.
+
+    limits maps a route class to (bucket capacity, tokens refilled per second);
+    route_classes maps a route class to the endpoint names it covers; every
+    other endpoint is 'default'. concurrency maps a route class to its
+    per-worker in-flight cap.
+    """
+
+    def __init__(self, app=None, backend=None, limits=None, route_classes=None,
+                 concurrency=None, exempt=(), trusted_proxies=0, enabled=True):
+        self.backend = backend or MemoryBackend()
+        self.limits = limits or {'default': (120, 2.0)}
+        self.route_classes = route_classes or {}
+        self.concurrency = concurrency or {}
+        self.exempt = set(exempt)
+        self.trusted_proxies = trusted_proxies
+        self.enabled = enabled
+
+        self._endpoint_class = {
+            endpoint: name for name, endpoints in self.route_classes.items() for endpoint in endpoints
+        }
+        self._in_flight = {name: 0 for name in self.concurrency}
+        self._in_flight_lock = threading.Lock()
+        self.stats = {'allowed': 0, 'limited': 0, 'shed': 0}
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def client_ip(self):
+        """Client address, taken from X-Forwarded-For entries added by trusted proxies.
+
+        With no trusted proxies the header is ignored and the socket address is used.
+        """
+        forwarded = request.headers.get('X-Forwarded-For', '')
+        hops = [h.strip() for h in forwarded.split(',') if h.strip()]
+        if hops and self.trusted_proxies:
+            return hops[-min(self.trusted_proxies, len(hops))]
+        return request.remote_addr or 'unknown'
+
+    def route_class(self, endpoint):
+        return self._endpoint_class.get(endpoint, 'default')
+
+    def in_flight(self, route_class):
+        return self._in_flight.get(route_class, 0)
+
+    def _reject(self, status, message, retry_after):
+        resp = jsonify({'error': message})
+        resp.status_code = status
+        resp.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return resp
+
+    def _before_request(self):
+        if not self.enabled or request.method == 'OPTIONS' or request.endpoint in self.exempt:
+            return None
+
+        route_class = self.route_class(request.endpoint)
+        capacity, refill_rate = self.limits.get(route_class, self.limits['default'])
+        try:
+            allowed, retry_after = self.backend.take(
+                f"{route_class}:{self.client_ip()}", capacity, refill_rate
+            )
+        except sqlite3.Error as e:
+            # Never fail a request because the limiter store is unavailable
+            logger.error(f"Rate limiter backend error: {e}")
+            allowed, retry_after = True, 0
+
+        if not allowed:
+            self.stats['limited'] += 1
+            return self._reject(429, 'Too many requests', retry_after)
+
+        cap = self.concurrency.get(route_class)
+        if cap:
+            with self._in_flight_lock:
+                if self._in_flight[route_class] >= cap:
+                    self.stats['shed'] += 1
+                    return self._reject(503, 'Server busy, please retry', 1)
+                self._in_flight[route_class] += 1
+            g.rate_limit_slot = route_class
+
+        self.stats['allowed'] += 1
+        return None
+
+    def _teardown_request(self, exc):
+        route_class = g.pop('rate_limit_slot', None)
+        if route_class is not None:
+            with self._in_flight_lock:
+                self._in_flight[route_class] -= 1
+
+
+def backend_from_env():
+    """Build the bucket backend selected by RATE_LIMIT_BACKEND."""
+    if os.environ.get('RATE_LIMIT_BACKEND', 'memory') == 'sqlite':
+        path = os.environ.get('RATE_LIMIT_DB', '/tmp/qfw-rate-limit.sqlite3')
+        try:
+            return SqliteBackend(path)
+        except sqlite3.Error as e:
+            logger.error(f"Cannot open rate limit store {path}: {e}; using in-memory buckets")
+    return MemoryBackend()
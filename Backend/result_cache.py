@@ -0,0 +1,116 @@
+"""Bounded LRU/TTL cache for computed responses, with single-flight coalescing.
+
+Entries are charged by the size of their serialized body, and least recently
+used entries are evicted once the byte budget is exceeded. While a key is
+being computed, other threads asking for the same key wait for that result
+instead of computing it again, so a burst of identical requests costs one
+computation.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# Rough per-entry bookkeeping cost added to the body size
+ENTRY_OVERHEAD = 256
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    def __init__(self, max_bytes, ttl, wait_timeout=30.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'expirations': 0}
+
+    def _lookup(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, size, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self._bytes -= size
+            self._stats['expirations'] += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key, value, size):
+        size += ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats['evictions'] += 1
+
+    def get_or_compute(self, key, compute, size_of=len, cacheable=None):
+        """Return the cached value for key, computing it once if absent.
+
+        compute() is called by exactly one thread per key at a time; size_of(value)
+        gives the bytes charged against the budget, and values for which
+        cacheable(value) is false are returned but not stored.
+        """
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is not None:
+                self._stats['hits'] += 1
+                return value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats['misses'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            if flight.done.wait(self.wait_timeout) and flight.error is None:
+                return flight.value
+            # The leader failed or stalled: compute independently
+            return compute()
+
+        try:
+            flight.value = compute()
+            if cacheable is None or cacheable(flight.value):
+                self._store(key, flight.value, size_of(flight.value))
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses'] + self._stats['coalesced']
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_rate=round(self._stats['hits'] / lookups, 4) if lookups else None,
+            )
@@ -0,0 +1,250 @@
+"""In-memory search structures built once per data version.
+
+``SuggestIndex`` answers typeahead prefix queries from a sorted key array
+using bisect. Every entry is indexed under its full normalized text and under
+each later word start, so "sch" finds "Black-Scholes". Results for prefixes
+up to ``PRECOMPUTED_PREFIX_LEN`` characters are precomputed, because those
+ranges cover most of the array; longer prefixes only scan a narrow slice.
+
+``TrigramIndex`` is the typo-tolerant fallback for question search. Query
+words missing from the vocabulary are matched to vocabulary words sharing the
+most character trigrams, then ranked by a bounded edit distance. Query
+length, candidate words per term and corrections per term are all capped, so
+the cost of a fuzzy query has a fixed upper bound.
+"""
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter
+
+import unidecode
+
+PRECOMPUTED_PREFIX_LEN = 3
+MAX_KEY_WORDS = 8
+MAX_KEY_LENGTH = 64
+MAX_QUERY_LENGTH = 64
+
+FUZZY_MAX_TERMS = 6
+FUZZY_MAX_TERM_LENGTH = 32
+FUZZY_MAX_CANDIDATES = 50
+FUZZY_MAX_CORRECTIONS = 3
+
+
+def normalize_search_text(text):
+    """Lowercase ASCII words separated by single spaces, as make_slug normalizes them."""
+    if not text:
+        return ""
+    text = unidecode.unidecode(str(text)).lower()
+    text = re.sub(r"[^\w\s-]", "", text)
+    text = re.sub(r"[\s_-]+", " ", text)
+    return text.strip()
+
+
+class SuggestIndex:
+    def __init__(self, entries, top_k=10):
+        """entries: iterable of dicts with 'text', 'type' and 'weight' (plus any payload)."""
+        self.entries = []
+        self.top_k = top_k
+        seen = set()
+        keys = []
+
+        for entry in entries:
+            norm = normalize_search_text(entry['text'])
+            if not norm or (entry['type'], norm) in seen:
+                continue
+            seen.add((entry['type'], norm))
+            idx = len(self.entries)
+            self.entries.append(entry)
+
+            words = norm.split(' ')
+            for start in range(min(len(words), MAX_KEY_WORDS)):
+                keys.append((' '.join(words[start:])[:MAX_KEY_LENGTH], idx))
+
+        keys.sort()
+        self._keys = [k for k, _ in keys]
+        self._ids = [i for _, i in keys]
+
+        candidates = {}
+        for key, idx in keys:
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LEN) + 1):
+                candidates.setdefault(key[:length], set()).add(idx)
+        self._short = {prefix: self._rank(ids) for prefix, ids in candidates.items()}
+
+    def _sort_key(self, idx):
+        entry = self.entries[idx]
+        return (-entry['weight'], len(entry['text']), entry['text'])
+
+    def _rank(self, ids):
+        return heapq.nsmallest(self.top_k, ids, key=self._sort_key)
+
+    def suggest(self, query, limit=8):
+        prefix = normalize_search_text(query[:MAX_QUERY_LENGTH])
+        if not prefix:
+            return []
+        limit = min(limit, self.top_k)
+
+        if len(prefix) <= PRECOMPUTED_PREFIX_LEN:
+            ids = self._short.get(prefix, [])
+        else:
+            lo = bisect_left(self._keys, prefix)
+            hi = bisect_left(self._keys, prefix + '\uffff', lo)
+            ids = self._rank(set(self._ids[lo:hi]))
+        return [self.entries[i] for i in ids[:limit]]
+
+
+def build_suggest_index(questions, firms, posts, resources):
+    """Typeahead index over questions, tags, key concepts, firms, blog and resource titles.
+
+    Tags, concepts and firms are weighted by how many questions use them, so
+    popular terms rank first; titles get a fixed weight above single questions.
+    """
+    entries = []
+    tag_counts = Counter()
+    concept_counts = Counter()
+    firm_counts = Counter()
+
+    for q in questions:
+        tag_counts.update(t for t in q.get('tags') or [] if isinstance(t, str))
+        concept_counts.update(c for c in q.get('key_concepts') or [] if isinstance(c, str))
+        if q.get('firm'):
+            firm_counts[q['firm'].strip()] += 1
+        if q.get('question'):
+            entries.append({'text': q['question'][:160], 'type': 'question', 'weight': 1, 'slug': q.get('slug')})
+
+    for tag, count in tag_counts.items():
+        entries.append({'text': tag, 'type': 'tag', 'weight': count})
+    for concept, count in concept_counts.items():
+        entries.append({'text': concept, 'type': 'concept', 'weight': count})
+
+    firm_slugs = {}
+    for firm in firms if isinstance(firms, list) else []:
+        if firm.get('name'):
+            firm_slugs[normalize_search_text(firm['name'])] = firm.get('slug') or firm.get('id')
+            firm_counts.setdefault(firm['name'], 0)
+    for name, count in firm_counts.items():
+        entries.append({
+            'text': name, 'type': 'firm', 'weight': count + 5,
+            'slug': firm_slugs.get(normalize_search_text(name))
+        })
+
+    for post in posts if isinstance(posts, list) else []:
+        if post.get('title'):
+            entries.append({'text': post['title'], 'type': 'blog', 'weight': 5, 'slug': post.get('slug') or post.get('id')})
+    for resource in resources if isinstance(resources, list) else []:
+        if resource.get('title'):
+            entries.append({
+                'text': resource['title'], 'type': 'resource', 'weight': 5,
+                'slug': resource.get('slug') or resource.get('id')
+            })
+
+    # Heavier entries first, so the higher-weighted of two duplicates is kept
+    entries.sort(key=lambda e: -e['weight'])
+    return SuggestIndex(entries)
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a, b, max_distance):
+    """Levenshtein distance, or max_distance + 1 as soon as it is known to exceed max_distance."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def max_typos(word):
+    if len(word) <= 4:
+        return 1
+    if len(word) <= 8:
+        return 2
+    return 3
+
+
+class TrigramIndex:
+    """Word-level trigram index over question text, tags, key concepts and firm."""
+
+    def __init__(self, questions):
+        # Own copy, so results never depend on later changes to the caller's list order
+        self.questions = list(questions)
+        self.words = []
+        self.postings = []
+        self.grams = {}
+        word_ids = {}
+
+        for position, q in enumerate(questions):
+            text = ' '.join([
+                str(q.get('question', '')),
+                ' '.join(str(t) for t in q.get('tags') or []),
+                ' '.join(str(c) for c in q.get('key_concepts') or []),
+                str(q.get('firm', '')),
+            ])
+            for word in set(normalize_search_text(text).split()):
+                if word not in word_ids:
+                    word_ids[word] = len(self.words)
+                    self.words.append(word)
+                    self.postings.append(set())
+                    for gram in trigrams(word):
+                        self.grams.setdefault(gram, []).append(word_ids[word])
+                self.postings[word_ids[word]].add(position)
+
+        self.word_ids = word_ids
+
+    def corrections(self, term):
+        """Closest vocabulary words to term as (word id, distance), best first."""
+        if term in self.word_ids:
+            return [(self.word_ids[term], 0)]
+        if len(term) < 3:
+            return []
+
+        overlap = Counter()
+        for gram in trigrams(term):
+            overlap.update(self.grams.get(gram, ()))
+        candidates = heapq.nlargest(FUZZY_MAX_CANDIDATES, overlap.items(), key=lambda item: item[1])
+
+        limit = max_typos(term)
+        scored = []
+        for word_id, _ in candidates:
+            distance = bounded_edit_distance(term, self.words[word_id], limit)
+            if distance <= limit:
+                scored.append((distance, self.words[word_id], word_id))
+        scored.sort()
+        return [(word_id, distance) for distance, _, word_id in scored[:FUZZY_MAX_CORRECTIONS]]
+
+    def search(self, query):
+        """Return (matching questions best first, corrected query string)."""
+        terms = [t[:FUZZY_MAX_TERM_LENGTH] for t in normalize_search_text(query[:MAX_QUERY_LENGTH]).split()]
+        terms = terms[:FUZZY_MAX_TERMS]
+
+        scores = None
+        corrected = []
+        for term in terms:
+            matches = self.corrections(term)
+            if not matches:
+                continue
+            corrected.append(self.words[matches[0][0]])
+
+            term_scores = {}
+            for word_id, distance in matches:
+                for position in self.postings[word_id]:
+                    if distance < term_scores.get(position, distance + 1):
+                        term_scores[position] = distance
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {p: scores[p] + d for p, d in term_scores.items() if p in scores}
+
+        if not scores:
+            return [], ' '.join(corrected)
+        ranked = sorted(scores, key=lambda p: (scores[p], p))
+        return [self.questions[p] for p in ranked], ' '.join(corrected)
@@ -0,0 +1,20 @@
+"""URL slugs shared by the server and the data compile stage."""
+import re
+
+import unidecode
+
+
+def make_slug(text, max_words=10):
+    """Generate URL-friendly slug from text."""
+    if not text:
+        return ""
+    text = unidecode.unidecode(text)
+    text = text.lower()
+    text = re.sub(r"[^\w\s-]", "", text)
+    text = re.sub(r"[\s_]+", "-", text)
+    words = text.split('-')
+    words = words[:max_words]
+    slug = "-".join(words)
+    slug = re.sub(r"-+", "-", slug)
+    slug = slug.strip('-')
+    return slug
@@ -0,0 +1,63 @@
+"""Aggregate counts over the data collections.
+
+Dashboards and filter sidebars only need counts (questions per firm, tag
+frequencies, resources per type, ...), not the records themselves. Each
+facet is counted in a single pass with collections.Counter, and list-valued
+fields such as tags count each element.
+"""
+from collections import Counter
+
+import bundles
+
+# Collection -> fields that can be counted and cross-tabulated
+STAT_FIELDS = {
+    'interview-questions': ('firm', 'category', 'difficulty', 'tags'),
+    'resources': ('type', 'category'),
+    'firms': ('category', 'location'),
+    'early-career': ('category', 'location'),
+    'blog': ('category', 'author', 'year'),
+    'faq': ('category',),
+}
+
+
+def field_values(record, field):
+    """Non-empty values of field in record; 'year' is derived from the record's date."""
+    if field == 'year':
+        return [bundles.by_year(record)]
+    value = record.get(field)
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if value is None or not str(value).strip():
+        return []
+    return [str(value).strip()]
+
+
+def _ordered(counter):
+    """Counter as a dict ordered by descending count, then value."""
+    return {value: n for value, n in sorted(counter.items(), key=lambda item: (-item[1], item[0]))}
+
+
+def summarize(records, fields):
+    records = [r for r in records if isinstance(r, dict)]
+    counts = {}
+    for field in fields:
+        counts[field] = _ordered(Counter(v for r in records for v in field_values(r, field)))
+    return {'total': len(records), 'counts': counts}
+
+
+def crosstab(records, row_field, column_field):
+    """Counts of every (row value, column value) pair, nested as {row: {column: n}}."""
+    pairs = Counter(
+        (row, column)
+        for r in records if isinstance(r, dict)
+        for row in field_values(r, row_field)
+        for column in field_values(r, column_field)
+    )
+    row_totals = Counter()
+    for (row, _), n in pairs.items():
+        row_totals[row] += n
+
+    table = {row: {} for row in _ordered(row_totals)}
+    for (row, column), n in sorted(pairs.items(), key=lambda item: (-item[1], item[0])):
+        table[row][column] = n
+    return {'rows': row_field, 'columns': column_field, 'counts': table}
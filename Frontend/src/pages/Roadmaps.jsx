@@ -195,7 +195,7 @@ function Roadmaps() {
         setLoading(true);
         setError(null);
         
-        const response = await fetch(`${API_URL}/api/roadmaps`);
+        const response = await fetch(`${API_URL}/api/roadmaps/summary`);
         
         if (!response.ok) {
           throw new Error(`Failed to fetch roadmaps: ${response.status}`);